@@ -2,65 +2,22 @@
 
 # https://github.com/mncoppola/ws30/blob/master/basefind.py
 
+import json
 import os
-import re
 import signal
-import struct
 import sys
-from operator import itemgetter
-
-chars = "A-Za-z0-9/\\-:.,_$%'\"()[\]<> "
-min_length = 10
-scores = []
-top_score = 0
-
-regexp = bytes("[{}]{{{:d},}}".format(chars, min_length), "us-ascii")
-pattern = re.compile(regexp)
-regexpc = bytes("[{}]{{1,}}".format(chars), "us-ascii")
-patternc = re.compile(regexpc)
-
-def get_strings(filename, size):
-    table = set()
-    offset = 0
-    with open(filename, "rb") as f:
-        while True:
-            if offset >= size:
-                break
-            f.seek(offset)
-            try:
-                data = f.read(10)
-            except:
-                break
-            match = pattern.match(data)
-            if match:
-                f.seek(offset - 1)
-                try:
-                    char = f.read(1)
-                except:
-                    continue
-                if not patternc.match(char):
-                    table.add(offset)
-                    offset += len(match.group(0))
-            offset += 1
-    return table
-
-def get_pointers(filename):
-    table = {}
-    with open(filename, "rb") as f:
-        while True:
-            try:
-                value = struct.unpack("<L", f.read(4))[0]
-                try:
-                    table[value] += 1
-                except KeyError:
-                    table[value] = 1
-            except:
-                break
-    return table
-
-def high_scores(signal, frame):
-    print("\nTop 20 base address candidates:")
-    for score in sorted(scores, key=itemgetter(1), reverse=True)[:20]:
+import time
+from grmn import cache
+from grmn.basefind import BaseScorer, estimate_base, filter_pointers, iter_search, load_state, load_tables, merge_top, refine_search, save_state, vote_bases
+from grmn.mapfile import map_file
+
+def terminate(signum, frame):
+    # Treat SIGTERM (e.g. batch job preemption) like Ctrl+C, so state gets saved
+    raise KeyboardInterrupt()
+
+def high_scores(scores):
+    print("\nTop {:d} base address candidates:".format(len(scores)))
+    for score in scores:
         print("0x{:x}\t{:d}".format(*score))
     sys.exit(0)
 
@@ -72,42 +29,118 @@ if __name__ == "__main__":
     parser.add_argument("--min_addr",  type=auto_int, help="start searching at this address", default=0)
     parser.add_argument("--max_addr",  type=auto_int, help="stop searching at this address", default=0xfe000000)
     parser.add_argument("--page_size", type=auto_int, help="search every this many byte", default=0x1000)
+    parser.add_argument("--align",     type=int, choices=[1, 2, 4], help="read pointers at file offsets aligned to this many bytes", default=4)
+    parser.add_argument("--big_endian", action="store_true", help="read pointers as big endian")
+    parser.add_argument("--solver",    choices=["sweep", "vote", "refine", "estimate"], help="try every base (sweep), vote with pointer/string differences (vote), search coarse-to-fine (refine) or combine header heuristics with voting (estimate)", default="sweep")
+    parser.add_argument("--max_pairs", type=int, help="vote: pair each pointer with at most this many strings", default=None)
+    parser.add_argument("--steps",     help="refine: comma-separated step sizes, coarse to fine (default: 0x100000,PAGE_SIZE)")
+    parser.add_argument("--max_buckets", type=int, help="refine: give up after refining this many buckets", default=1024)
+    parser.add_argument("--no_cache",  action="store_true", help="don't use or store cached string and pointer tables")
+    parser.add_argument("--cache_dir", help="directory for cached tables (default: {})".format(cache.CACHE_DIR))
+    parser.add_argument("--jobs",      type=int, help="number of worker processes (default: all CPUs)", default=None)
+    parser.add_argument("--top",       type=int, help="show this many candidates", default=20)
+    parser.add_argument("--state",     help="periodically save search position and top candidates to this file")
+    parser.add_argument("--resume",    action="store_true", help="continue the search saved in the --state file")
+    parser.add_argument("--checkpoint_interval", type=float, help="seconds between saves of the --state file", default=60)
+    parser.add_argument("--progress",  help="write JSON progress records to this file (- for stderr)")
     parser.add_argument("infile", help="file to scan")
     args = parser.parse_args()
 
+    if args.resume and not args.state:
+        parser.error("--resume requires --state")
+
     size = os.path.getsize(args.infile)
-    scores = []
+    state = {
+        "infile": os.path.abspath(args.infile),
+        "size": size,
+        "min_addr": args.min_addr,
+        "max_addr": args.max_addr,
+        "page_size": args.page_size,
+        "align": args.align,
+        "big_endian": args.big_endian,
+        "solver": args.solver,
+        "next_base": args.min_addr,
+        "top": [],
+    }
+    if args.resume and os.path.exists(args.state):
+        saved = load_state(args.state)
+        for key in ["infile", "size", "min_addr", "max_addr", "page_size", "align", "big_endian", "solver"]:
+            if saved.get(key) != state[key]:
+                parser.error("--state file is for a different search ({} is {}, not {})".format(key, saved.get(key), state[key]))
+        state = saved
+        print("Resuming at base address 0x{:x}".format(state["next_base"]))
+
+    progress = None
+    if args.progress == "-":
+        progress = sys.stderr
+    elif args.progress:
+        progress = open(args.progress, "at")
+
+    if args.cache_dir:
+        cache.set_cache_dir(args.cache_dir)
 
-    print("Scanning binary for strings...")
-    str_table = get_strings(args.infile, size)
+    if args.solver == "estimate":
+        print("Base address candidates (base, score, evidence):")
+        for candidate in estimate_base(map_file(args.infile), min_addr=args.min_addr, max_addr=args.max_addr, step=args.page_size, top_n=args.top, use_cache=not args.no_cache, big_endian=args.big_endian, align=args.align):
+            print(candidate)
+        sys.exit(0)
+
+    print("Scanning binary for strings and pointers...")
+    (str_table, ptr_values, ptr_counts) = load_tables(map_file(args.infile), big_endian=args.big_endian, align=args.align, use_cache=not args.no_cache)
     print("Total strings found: {:d}".format(len(str_table)))
+    # Pointers outside [min_addr, max_addr + size) can't point into the file for any tried base
+    (ptr_values, ptr_counts) = filter_pointers(ptr_values, ptr_counts, args.min_addr, args.max_addr + size)
+    print("Total pointers found: {:d}".format(len(ptr_values)))
+
+    scorer = BaseScorer(ptr_values, ptr_counts, str_table, size)
 
-    print("Scanning binary for pointers...")
-    ptr_table = get_pointers(args.infile)
-    print("Total pointers found: {:d}".format(len(ptr_table)))
+    if args.solver == "vote":
+        high_scores(vote_bases(scorer, args.min_addr, args.max_addr, args.page_size, args.top, args.max_pairs))
+    elif args.solver == "refine":
+        steps = (0x100000, args.page_size)
+        if args.steps:
+            steps = tuple(auto_int(x) for x in args.steps.split(","))
+        (scores, exact) = refine_search(scorer, args.min_addr, args.max_addr, steps, args.top, args.max_buckets)
+        if not exact:
+            print("Refined {:d} buckets without proving the result, try a higher --max_buckets.".format(args.max_buckets))
+        high_scores(scores)
 
-    signal.signal(signal.SIGINT, high_scores)
+    signal.signal(signal.SIGTERM, terminate)
 
-    for base in range(args.min_addr, args.max_addr, args.page_size):
-        if base % ( args.page_size * 1000 ) == 0:
-            print("Trying base address 0x{:x}".format(base))
+    scores = state["top"]
+    top_score = 0
+    if len(scores) > 0:
+        top_score = scores[0][1]
+    next_base = state["next_base"]
+    start_time = time.monotonic()
+    last_checkpoint = start_time
+    try:
+        for (chunk_start, chunk_stop, chunk_top) in iter_search(scorer, next_base, args.max_addr, args.page_size, args.top, args.jobs):
+            print("Tried base addresses up to 0x{:x}".format(chunk_stop))
             print("\u001b[F\u001b[K", end="")
-        score = 0
-        ptrs = list(ptr_table.keys())
-        for ptr in ptrs:
-            if ptr < base:
-                #print("Removing pointer 0x{:x} from table".format(ptr))
-                del ptr_table[ptr]
-                continue
-            if ptr >= (base + size):
-                continue
-            offset = ptr - base
-            if offset in str_table:
-                score += ptr_table[ptr]
-        if score:
-            scores.append((base, score))
-            if score > top_score:
-                top_score = score
-                print("New highest score, 0x{:x}: {:d}".format(base, score))
-
-    high_scores(0, 0)
+            scores = merge_top([scores, chunk_top], args.top)
+            if len(scores) > 0 and scores[0][1] > top_score:
+                top_score = scores[0][1]
+                print("New highest score, 0x{:x}: {:d}".format(*scores[0]))
+            next_base = chunk_stop
+            now = time.monotonic()
+            if progress:
+                rate = (chunk_stop - state["next_base"]) // args.page_size / max(now - start_time, 1e-6)
+                record = {
+                    "done_from": args.min_addr,
+                    "done_to": chunk_stop,
+                    "max_addr": args.max_addr,
+                    "bases_per_sec": round(rate, 1),
+                    "best": scores[0] if len(scores) > 0 else None,
+                }
+                print(json.dumps(record), file=progress, flush=True)
+            if args.state and now - last_checkpoint >= args.checkpoint_interval:
+                save_state(args.state, dict(state, next_base=next_base, top=scores))
+                last_checkpoint = now
+    except KeyboardInterrupt:
+        pass
+
+    if args.state:
+        save_state(args.state, dict(state, next_base=next_base, top=scores))
+
+    high_scores(scores)
@@ -7,57 +7,55 @@
 Calculates possible base address.
 """
 
+from grmn.endmarker import END_MARKER, find_all
+from grmn.mapfile import map_file
 from struct import unpack
-import os.path
-import sys
-
-FILE = sys.argv[1]
-OFFSET = 0
-if len(sys.argv) > 2:
-  OFFSET = int(sys.argv[2])
-BLOCKSIZE = 4096
-
-END_MARKER = b"\xff\xff\x5a\xa5"
-
-first_block = True
-end_marker_pos = 0xffffffff
-print("Reading {} ...".format(FILE))
-with open(FILE, "rb") as f:
-    f.read(OFFSET)
-    while True:
-        block = f.read(BLOCKSIZE)
-        if first_block:
-            dw = unpack("<LLLLL", block[0:20])
-            first_block = False
-        if END_MARKER in block:
-            end_pos = block.find(END_MARKER)
-            found_pos = f.tell() - len(block) + end_pos + 2
-            if found_pos > end_marker_pos:
-                print("Found a second endmarker! Using that one.")
-            end_marker_pos = found_pos
-            #break
-        if len(block) < BLOCKSIZE:
-            break
-    f.close()
-
-size = os.path.getsize(FILE)
-
-print("File is {} (0x{:x}) Bytes.".format(size, size))
-print("First double-words: 0x{:x} / 0x{:x} / 0x{:x} / 0x{:x} / 0x{:x}".format(dw[0], dw[1], dw[2], dw[3], dw[4]))
-print("Assuming this is end marker location in memory: 0x{:x}".format(dw[1]))
-print("Found end marker in file at: 0x{:x}".format(end_marker_pos))
-
-base_addr = dw[1] - (end_marker_pos - OFFSET)
-if base_addr < 0:
-    base_addr += 0xffffffff
-
-print("This would make Base address probably 0x{:x}".format(base_addr))
-
-if base_addr % 4 != 0:
-    print("However, bad alignment. Calculated base address not aligned to doublewords.")
-
-if base_addr + size > 0xffffffff:
-    print("However, base address can't fit whole file.")
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--offset", type=lambda x: int(x, 0), help="binary starts at this offset in the file", default=0)
+parser.add_argument("infiles", nargs="+", metavar="FILE", help="file(s) to check")
+args = parser.parse_args()
+
+OFFSET = args.offset
+
+for FILE in args.infiles:
+    print("Reading {} ...".format(FILE))
+    payload = map_file(FILE)
+    size = len(payload)
+    print("File is {} (0x{:x}) Bytes.".format(size, size))
+    if size < OFFSET + 20:
+        print("File too small.")
+        print()
+        continue
+
+    dw = unpack("<LLLLL", payload[OFFSET:OFFSET+20])
+    markers = find_all(payload, END_MARKER, OFFSET)
+
+    print("First double-words: 0x{:x} / 0x{:x} / 0x{:x} / 0x{:x} / 0x{:x}".format(dw[0], dw[1], dw[2], dw[3], dw[4]))
+    print("Assuming this is end marker location in memory: 0x{:x}".format(dw[1]))
+    if len(markers) == 0:
+        print("No end marker found in file.")
+        print()
+        continue
+    if len(markers) > 1:
+        print("Found {} end markers at {}! Using the last one.".format(len(markers), ", ".join("0x{:x}".format(m + 2) for m in markers)))
+    end_marker_pos = markers[-1] + 2
+    print("Found end marker in file at: 0x{:x}".format(end_marker_pos))
+
+    base_addr = dw[1] - (end_marker_pos - OFFSET)
+    if base_addr < 0:
+        base_addr += 0xffffffff
+
+    print("This would make Base address probably 0x{:x}".format(base_addr))
+
+    if base_addr % 4 != 0:
+        print("However, bad alignment. Calculated base address not aligned to doublewords.")
+
+    if base_addr + size > 0xffffffff:
+        print("However, base address can't fit whole file.")
+
+    print()
 
 # Assumes second dword points to hwid
 #if dw[2] % 2 != 0 or dw[2] - base_addr >= end_marker_pos - 3:
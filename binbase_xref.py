@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Lists all pointers to strings of a binary loaded at the given base address.
+"""
+
+from grmn import xref
+from grmn.mapfile import map_file
+import argparse
+import sys
+
+def auto_int(x):
+    return int(x, 0)
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--align",      type=int, choices=[1, 2, 4], help="read pointers at file offsets aligned to this many bytes", default=4)
+parser.add_argument("--big_endian", action="store_true", help="read pointers as big endian")
+parser.add_argument("--output",     help="write to this file, SQLite if it ends with .db/.sqlite, else JSONL (default: stdout)")
+parser.add_argument("base", type=auto_int, help="base address (e.g. from binbase_find.py)")
+parser.add_argument("infile", help="file to scan")
+args = parser.parse_args()
+
+xrefs = xref.iter_xrefs(map_file(args.infile), args.base, big_endian=args.big_endian, align=args.align)
+
+if args.output is None:
+    xref.write_jsonl(sys.stdout, xrefs)
+elif args.output.endswith((".db", ".sqlite")):
+    count = xref.write_sqlite(args.output, xrefs)
+    print("Wrote {:d} cross references to {}".format(count, args.output))
+else:
+    with open(args.output, "wt") as f:
+        count = xref.write_jsonl(f, xrefs)
+        f.close()
+    print("Wrote {:d} cross references to {}".format(count, args.output))
@@ -2,39 +2,58 @@
 # -*- coding: utf-8 -*-
 
 """
-Parses a binary file for 006-Bxxxx-xx or 006Bxxxxxx occurrances.
+Parses binary files for 006-Bxxxx-xx or 006Bxxxxxx occurrances.
 """
 
-import os.path
-import re
-import sys
-from grmn import devices
-
-FILE = sys.argv[1]
-
-pattern = re.compile(rb"006-?B\d\d\d\d-?[0-9A-F]{2}")
-
-print("Reading {} ...".format(FILE))
-with open(FILE, "rb") as f:
-    data = f.read()
-    f.close()
-
-matches = pattern.findall(data)
-results = []
-
-for i in matches:
-    i = i.decode("utf-8")
-    if len(i) == 10:
-        i = "{}-{}-{}".format(i[0:3], i[3:8], i[8:])
-    results.append(i)
-
-results = sorted(set(results))
-
-for r in results:
-    print(r, end="")
-    hw_id = r[5:9]
-    sub_id = r[10:]
-    device_name = devices.get_name(hw_id, sub_id)
-    if device_name:
-        print(" - {}".format(device_name), end="")
-    print()
+from grmn import components, devices, hwids
+import argparse
+import json
+
+def get_device_name(sku):
+    hw_id = sku[5:9]
+    sub_id = sku[10:]
+    return devices.get_name(hw_id, sub_id)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--offsets", action="store_true", help="also show offsets of all occurrences")
+    parser.add_argument("--jobs", type=int, help="number of worker processes (default: all CPUs)", default=None)
+    parser.add_argument("--json", action="store_true", help="output JSON")
+    parser.add_argument("paths", nargs="+", metavar="PATH", help="files or directories to scan")
+    args = parser.parse_args()
+
+    results = []
+    for (filename, hits) in hwids.scan_paths(args.paths, args.jobs):
+        results.append((filename, hits))
+        if args.json:
+            continue
+        print("Reading {} ...".format(filename))
+        offsets = {}
+        for (offset, sku) in hits:
+            offsets.setdefault(sku, []).append(offset)
+        for r in sorted(offsets):
+            print(r, end="")
+            device_name = get_device_name(r)
+            if device_name:
+                print(" - {}".format(device_name), end="")
+            if args.offsets:
+                print(" @ {}".format(", ".join("0x{:x}".format(o) for o in offsets[r])), end="")
+            print()
+
+    sku_files = hwids.aggregate(results)
+
+    if args.json:
+        print(json.dumps({
+            "files": {filename: [{"offset": o, "sku": s} for (o, s) in hits] for (filename, hits) in results},
+            "skus": sku_files,
+            "components": {sku: components.get_paths(sku) for sku in sku_files},
+        }))
+    elif len(results) > 1:
+        print()
+        print("SKU -> files:")
+        for (sku, filenames) in sku_files.items():
+            print("{} ({}):".format(sku, get_device_name(sku) or "Unknown device"))
+            for filename in filenames:
+                print("  {}".format(filename))
+            for path in components.get_paths(sku):
+                print("  (component: {})".format(path))
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Lists printable strings of a GCD, RGN or BIN file with their region and offset.
+"""
+
+from grmn import basefind, factory, strings
+from grmn.mapfile import map_file
+import argparse
+import grmn
+import re
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--min_length", type=int, help="minimum string length", default=strings.MIN_LENGTH)
+parser.add_argument("--charset", choices=["printable", "basefind"], help="characters allowed in strings", default="printable")
+parser.add_argument("--grep", help="only show strings matching this regular expression")
+parser.add_argument("--no_cache", action="store_true", help="don't use or store cached results")
+parser.add_argument("infile", help="file to scan")
+args = parser.parse_args()
+
+charset = strings.PRINTABLE
+if args.charset == "basefind":
+    charset = strings.charset_from_class(basefind.CHARS)
+grep = None
+if args.grep:
+    grep = re.compile(args.grep)
+
+obj = map_file(args.infile)
+# BIN and unknown files are scanned as a whole, parsing RgnBin metadata isn't needed
+if factory.sniff(obj) in ["GCD", "RGN"]:
+    obj = grmn.open(args.infile)
+for (region, payload, offsets, lengths) in strings.get_region_strings(obj, charset, args.min_length, not args.no_cache):
+    if region is None:
+        region_str = "-"
+    elif isinstance(obj, grmn.Gcd):
+        region_str = "{:04x}@0x{:x}".format(region[0], region[1])
+    else:
+        region_str = ">".join("{:04x}".format(r) for r in region)
+    for (offset, length) in zip(offsets.tolist(), lengths.tolist()):
+        text = bytes(payload[offset:offset+length]).decode("latin-1")
+        if grep and not grep.search(text):
+            continue
+        print("{}\t0x{:08x}\t{}".format(region_str, offset, text))
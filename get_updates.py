@@ -7,12 +7,22 @@ Queries the updateserver for given device's updates.
 
 __author__ = "mbirth"
 
-from grmn import updateserver, devices
+from grmn import updateserver, devices, devsearch, httpclient
 from optparse import OptionParser, OptionGroup
 import json
 import os.path
 import sys
 
+def print_stats():
+    """
+    Prints request and cache metrics to stderr if --stats was given.
+    """
+    if not opts.stats:
+        return
+    print(client.format_stats(), file=sys.stderr)
+    if response_cache is not None:
+        print(response_cache.format_stats(), file=sys.stderr)
+
 optp = OptionParser(usage="usage: %prog [options] SKU1 [SKU2..SKUn]")
 optp.add_option("-c", "--changelog", action="store_true", dest="changelog", help="also show changelog")
 optp.add_option("-l", "--license", action="store_true", dest="license", help="also show license")
@@ -24,6 +34,20 @@ optp.add_option("--code", action="append", dest="unlock_codes", metavar="UNLOCK_
 optp.add_option("--devicexml", dest="devicexml", metavar="FILE", help="Use specified GarminDevice.xml (also implies -E)")
 optp.add_option("--json", action="store_true", dest="json", default=False, help="Output JSON")
 optp.add_option("--list-devices", action="store_true", dest="list_devices", default=False, help="Show a list of SKUs and product names")
+optp.add_option("--search", dest="search", metavar="NAME", help="Search hw_ids by product name")
+optp.add_option("--search-mode", dest="search_mode", choices=devsearch.MODES, default="auto", help="Name search mode: {} (default: %default)".format(", ".join(devsearch.MODES)))
+optp.add_option("--timeout", type="float", dest="timeout", metavar="SECONDS", default=httpclient.READ_TIMEOUT, help="Server reply timeout (default: %default)")
+optp.add_option("--retries", type="int", dest="retries", default=httpclient.RETRIES, help="Retries on connection errors and 5xx replies (default: %default)")
+optp.add_option("--stats", action="store_true", dest="stats", default=False, help="Print request metrics to stderr when done")
+optp.add_option("--bulk", action="store_true", dest="bulk", default=False, help="Query SKUs in separate batches concurrently, print results as they arrive")
+optp.add_option("--sku-file", dest="sku_file", metavar="FILE", help="Read additional SKUs from FILE (- for stdin), whitespace separated")
+optp.add_option("--jobs", type="int", dest="jobs", default=8, help="Concurrent queries in bulk mode (default: %default)")
+optp.add_option("--batch-size", type="int", dest="batch_size", default=10, help="SKUs per query in bulk mode (default: %default)")
+optp.add_option("--rate", type="float", dest="rate", default=5.0, help="Max. requests per second per server in bulk mode, 0 for unlimited (default: %default)")
+optp.add_option("--no-cache", action="store_false", dest="cache", default=True, help="Don't use or store cached server replies")
+optp.add_option("--refresh", action="store_true", dest="refresh", default=False, help="Ignore cached server replies, but store the new ones")
+optp.add_option("--cache-ttl", type="float", dest="cache_ttl", metavar="SECONDS", default=updateserver.RESPONSE_CACHE_TTL, help="Max. age of cached server replies (default: %default)")
+optp.add_option("--cache-size", type="int", dest="cache_size", metavar="MB", default=updateserver.RESPONSE_CACHE_MAX_SIZE // (1024 * 1024), help="Max. size of the reply cache (default: %default)")
 optp.add_option("--debug", action="store_true", dest="debug", default=False, help="Dump raw server requests and replies to files")
 
 optp.usage = """
@@ -36,6 +60,13 @@ Examples:
 
 (opts, device_skus) = optp.parse_args()
 
+if opts.sku_file:
+    if opts.sku_file == "-":
+        device_skus += sys.stdin.read().split()
+    else:
+        with open(opts.sku_file, "rt") as f:
+            device_skus += f.read().split()
+
 if opts.list_devices:
     if opts.json:
         print(json.dumps(devices.DEVICES))
@@ -46,11 +77,28 @@ if opts.list_devices:
         print()
         print("SKU format is 006-Bxxxx-00 with xxxx being the HWID.")
     sys.exit(0)
+elif opts.search:
+    results = devsearch.search(opts.search, opts.search_mode)
+    if opts.json:
+        print(json.dumps([{"hwid": hwid, "subid": subid, "name": name} for (hwid, subid, name) in results]))
+    else:
+        for (hwid, subid, name) in results:
+            print("006-B{:04d}-{:02d} - {}".format(hwid, subid, name))
+    sys.exit(0)
 elif len(device_skus) < 1 and not opts.devicexml:
     optp.print_help()
     sys.exit(1)
 
-us = updateserver.UpdateServer()
+client = httpclient.HttpClient(timeout=(httpclient.CONNECT_TIMEOUT, opts.timeout), retries=opts.retries, pool_size=max(httpclient.POOL_SIZE, opts.jobs))
+response_cache = None
+if opts.cache:
+    try:
+        response_cache = updateserver.ResponseCache(ttl=opts.cache_ttl, max_size=opts.cache_size * 1024 * 1024)
+    except OSError as e:
+        print("WARNING: Reply cache not available ({}), continuing without it.".format(e), file=sys.stderr)
+us = updateserver.UpdateServer(client, response_cache)
+
+us.refresh_cache = opts.refresh
 
 if opts.debug:
     us.debug = True
@@ -77,6 +125,7 @@ if opts.devicexml:
             results.append(r)
 
     print(results)
+    print_stats()
     sys.exit(0)
 
 # If no GarminDevice.xml read from file, continue here
@@ -84,7 +133,7 @@ for i, sku in enumerate(device_skus):
     if len(sku) <= 4:
         device_skus[i] = "006-B{:>04}-00".format(sku)
 
-if device_skus[0][0:5] == "006-B" and not opts.quiet:
+if device_skus[0][0:5] == "006-B" and not opts.quiet and not opts.bulk:
     primary_hwid = int(device_skus[0][5:9])
     primary_subid = device_skus[0][10:]
     device_name = devices.get_name(primary_hwid, primary_subid, "Unknown device")
@@ -98,6 +147,21 @@ for uc in opts.unlock_codes:
     print("Unlock Code: {}".format(uc))
     us.unlock_codes.append(uc)
 
+if opts.bulk:
+    if opts.rate > 0:
+        client.set_rate_limit(opts.rate)
+    for (batch, source, results, error) in us.query_bulk(device_skus, opts.express, opts.webupdater, opts.jobs, opts.batch_size):
+        if error is not None:
+            print("ERROR: {} query for {} failed: {}".format(source, " ".join(batch), error), file=sys.stderr)
+            continue
+        for r in results:
+            if opts.json:
+                print(json.dumps(vars(r)), flush=True)
+            else:
+                print(r, flush=True)
+    print_stats()
+    sys.exit(0)
+
 results = []
 
 if opts.express:
@@ -123,3 +187,5 @@ for r in results:
             print("\n\nNotes:\n" + r.notes)
         if r.additional_info_url:
             print("\nAdditional Information: " + r.additional_info_url)
+
+print_stats()
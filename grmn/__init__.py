@@ -3,3 +3,4 @@
 from .gcd import *
 from .rgn import *
 from .chksum import *
+from .factory import open
@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+
+"""
+Building blocks for finding the load (base) address of a firmware binary
+by matching pointers against string locations.
+Based on https://github.com/mncoppola/ws30/blob/master/basefind.py
+"""
+
+from . import cache, strings
+from .endmarker import END_MARKER, find_last
+from .rgnbin import get_load_address
+from concurrent.futures import ProcessPoolExecutor
+from struct import unpack
+import heapq
+import itertools
+import json
+import numpy as np
+
+CHARS = "A-Za-z0-9/\\-:.,_$%'\"()[\\]<> "
+MIN_LENGTH = 10
+
+def get_strings(payload: bytes, chars: str=CHARS, min_length: int=MIN_LENGTH):
+    """
+    Returns a sorted array of the start offsets of all strings of at least
+    min_length characters from chars. A string starting right after another
+    allowed character is part of the longer string and not counted.
+    payload can be any bytes-like object, e.g. a memoryview from map_file().
+    """
+    return strings.extract(payload, strings.charset_from_class(chars), min_length)[0]
+
+def get_pointers(payload: bytes, big_endian: bool=False, align: int=4, min_value: int=None, max_value: int=None):
+    """
+    Reads all 32 bit words at file offsets which are multiples of align (1, 2 or 4)
+    and returns arrays (values, counts) of the unique values and their number of
+    occurrences. Only values in [min_value, max_value) are kept, if given.
+    """
+    if align not in (1, 2, 4):
+        raise ValueError("align must be 1, 2 or 4")
+    dtype = np.dtype(">u4" if big_endian else "<u4")
+    words = []
+    for offset in range(0, 4, align):
+        count = (len(payload) - offset) // 4
+        if count <= 0:
+            continue
+        values = np.frombuffer(payload, dtype=dtype, count=count, offset=offset)
+        if min_value is not None:
+            values = values[values >= min_value]
+        if max_value is not None:
+            values = values[values < max_value]
+        words.append(values)
+    if len(words) == 0:
+        return (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+    (values, counts) = np.unique(np.concatenate(words), return_counts=True)
+    return (values.astype(np.int64), counts.astype(np.int64))
+
+def load_tables(payload: bytes, chars: str=CHARS, min_length: int=MIN_LENGTH, big_endian: bool=False, align: int=4, use_cache: bool=True):
+    """
+    Returns arrays (str_offsets, ptr_values, ptr_counts) for the payload. If use_cache,
+    the tables are stored in and reused from the cache, keyed by the payload's content hash.
+    """
+    if use_cache:
+        key = cache.make_key(cache.content_hash(payload), "basefind", chars, min_length, big_endian, align)
+        tables = cache.load_arrays(key)
+        if tables is not None:
+            return (tables["str_offsets"], tables["ptr_values"], tables["ptr_counts"])
+    str_offsets = get_strings(payload, chars, min_length)
+    (ptr_values, ptr_counts) = get_pointers(payload, big_endian, align)
+    if use_cache:
+        cache.save_arrays(key, str_offsets=str_offsets, ptr_values=ptr_values, ptr_counts=ptr_counts)
+    return (str_offsets, ptr_values, ptr_counts)
+
+def filter_pointers(ptr_values, ptr_counts, min_value: int, max_value: int):
+    """
+    Returns the (sorted) pointer values and counts limited to [min_value, max_value).
+    """
+    (lo, hi) = np.searchsorted(ptr_values, (min_value, max_value))
+    return (ptr_values[lo:hi], ptr_counts[lo:hi])
+
+class BaseScorer:
+    """
+    Scores candidate base addresses: the score of a base is the number of pointers
+    that point to the start of a string if the file is loaded at that base.
+    """
+
+    def __init__(self, ptr_values, ptr_counts, str_offsets, size: int):
+        ptr_values = np.asarray(ptr_values, dtype=np.int64)
+        order = np.argsort(ptr_values, kind="stable")
+        self.ptr_values = ptr_values[order]
+        self.ptr_counts = np.asarray(ptr_counts, dtype=np.int64)[order]
+        self.str_offsets = np.unique(np.asarray(str_offsets, dtype=np.int64))
+        self.size = size
+
+    def score(self, base: int):
+        """
+        Returns the score for the given base address.
+        """
+        (lo, hi) = np.searchsorted(self.ptr_values, (base, base + self.size))
+        if lo == hi or len(self.str_offsets) == 0:
+            return 0
+        offsets = self.ptr_values[lo:hi] - base
+        idx = np.searchsorted(self.str_offsets, offsets)
+        np.minimum(idx, len(self.str_offsets) - 1, out=idx)
+        hits = self.str_offsets[idx] == offsets
+        return int(self.ptr_counts[lo:hi][hits].sum())
+
+    def upper_bound(self, start: int, span: int):
+        """
+        Returns an upper bound for the score of every base in [start, start+span):
+        the sum of counts of all pointers with at least one string start they
+        could hit from any of these bases.
+        """
+        (lo, hi) = np.searchsorted(self.ptr_values, (start, start + span + self.size - 1))
+        if lo == hi or len(self.str_offsets) == 0:
+            return 0
+        offsets = self.ptr_values[lo:hi] - start
+        # Strings in (offset - span, offset] are reachable
+        first = np.searchsorted(self.str_offsets, offsets - span, side="right")
+        last = np.searchsorted(self.str_offsets, offsets, side="right")
+        return int(self.ptr_counts[lo:hi][last > first].sum())
+
+def top_scores(scorer: BaseScorer, start: int, stop: int, step: int, top_n: int=20):
+    """
+    Scores all bases in range(start, stop, step) and returns the top_n
+    non-zero (base, score) tuples, best first. Only keeps a bounded heap.
+    """
+    heap = []
+    for base in range(start, stop, step):
+        score = scorer.score(base)
+        if score == 0:
+            continue
+        # Lower bases win ties, like with a stable sort of all scores
+        entry = (score, -base)
+        if len(heap) < top_n:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    return merge_top([[(-neg_base, score) for (score, neg_base) in heap]], top_n)
+
+def merge_top(results, top_n: int=20):
+    """
+    Merges several lists of (base, score) tuples into one top_n list, best first.
+    """
+    return heapq.nsmallest(top_n, itertools.chain.from_iterable(results), key=lambda x: (-x[1], x[0]))
+
+_worker_scorer = None
+
+def _init_worker(scorer: BaseScorer):
+    global _worker_scorer
+    _worker_scorer = scorer
+
+def _search_chunk(args):
+    (start, stop, step, top_n) = args
+    return (start, stop, top_scores(_worker_scorer, start, stop, step, top_n))
+
+def iter_search(scorer: BaseScorer, min_addr: int, max_addr: int, step: int, top_n: int=20, workers: int=None, chunk_size: int=0x1000):
+    """
+    Splits range(min_addr, max_addr, step) into chunks of chunk_size bases, scores them
+    in a pool of worker processes and yields (chunk_start, chunk_stop, top list) in order.
+    """
+    chunk_span = step * chunk_size
+    chunks = [(start, min(start + chunk_span, max_addr), step, top_n) for start in range(min_addr, max_addr, chunk_span)]
+    if workers == 1:
+        for chunk in chunks:
+            yield (chunk[0], chunk[1], top_scores(scorer, *chunk))
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(scorer,)) as executor:
+        try:
+            yield from executor.map(_search_chunk, chunks)
+        except BaseException:
+            # e.g. KeyboardInterrupt or generator closed early
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+def search(scorer: BaseScorer, min_addr: int, max_addr: int, step: int, top_n: int=20, workers: int=None, chunk_size: int=0x1000):
+    """
+    Returns the top_n (base, score) tuples of range(min_addr, max_addr, step), best first.
+    """
+    results = [chunk_top for (_, _, chunk_top) in iter_search(scorer, min_addr, max_addr, step, top_n, workers, chunk_size)]
+    return merge_top(results, top_n)
+
+def vote_bases(scorer: BaseScorer, min_addr: int, max_addr: int, step: int, top_n: int=20, max_pairs: int=None, chunk_pairs: int=1 << 22):
+    """
+    Difference voting: every pair of pointer p and string start s gives count(p)
+    votes to base p - s, if that base is in range(min_addr, max_addr, step). The
+    votes of a base are exactly its score, but only bases hit by at least one pair
+    are looked at. Pairs are found per pointer by binary search over the string
+    starts sorted by (offset % step, offset), so this runs in O((P+S) log S + pairs).
+    With max_pairs, only that many string starts nearest to p - min_addr are
+    paired with each pointer, which bounds the work for small steps. The best
+    candidates are then verified and ranked with the exhaustive scorer.
+    Returns up to top_n (base, score) tuples, best first.
+    """
+    size = scorer.size
+    strs = scorer.str_offsets
+    ptrs = scorer.ptr_values
+    counts = scorer.ptr_counts
+    if len(strs) == 0 or len(ptrs) == 0:
+        return []
+    # Composite sort key keeps string starts grouped by residue and sorted by offset within
+    keys = (strs % step) * (size + 1) + strs
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    strs = strs[order]
+    res_keys = ((ptrs - min_addr) % step) * (size + 1)
+    s_lo = np.maximum(ptrs - max_addr + 1, 0)
+    s_hi = np.minimum(ptrs - min_addr, size - 1)
+    lo = np.searchsorted(keys, res_keys + s_lo, side="left")
+    hi = np.searchsorted(keys, res_keys + s_hi, side="right")
+    if max_pairs is not None:
+        lo = np.maximum(lo, hi - max_pairs)
+    n = np.maximum(hi - lo, 0)
+
+    votes = []
+    cum_n = np.cumsum(n)
+    i = 0
+    while i < len(ptrs):
+        done = cum_n[i - 1] if i > 0 else 0
+        j = max(int(np.searchsorted(cum_n, done + chunk_pairs, side="right")), i + 1)
+        chunk_n = n[i:j]
+        total = int(chunk_n.sum())
+        if total > 0:
+            rep = np.repeat(np.arange(i, j), chunk_n)
+            within = np.arange(total) - np.repeat(np.cumsum(chunk_n) - chunk_n, chunk_n)
+            bases = ptrs[rep] - strs[lo[rep] + within]
+            (unique_bases, inverse) = np.unique(bases, return_inverse=True)
+            votes.append((unique_bases, np.bincount(inverse, weights=counts[rep])))
+        i = j
+    if len(votes) == 0:
+        return []
+    (unique_bases, inverse) = np.unique(np.concatenate([v[0] for v in votes]), return_inverse=True)
+    weights = np.bincount(inverse, weights=np.concatenate([v[1] for v in votes]))
+
+    # Capped pairs may undercount, so verify more candidates than requested
+    num_candidates = top_n if max_pairs is None else top_n * 4
+    best = np.argsort(-weights, kind="stable")[:num_candidates]
+    candidates = [(int(unique_bases[k]), scorer.score(int(unique_bases[k]))) for k in best]
+    return merge_top([[c for c in candidates if c[1] > 0]], top_n)
+
+def refine_search(scorer: BaseScorer, min_addr: int, max_addr: int, steps=(0x100000, 0x1000), top_n: int=20, max_buckets: int=1024):
+    """
+    Coarse-to-fine search: the range is split into buckets of steps[0] bytes, which
+    get an upper bound score. The bucket with the highest bound is split into buckets
+    of the next step, and so on, until the buckets of the second-to-last level get
+    their bases scored at the last step (e.g. 0x1000 or 4). Each step should be a
+    multiple of the next one.
+    Stops when no remaining bucket can beat the top_n candidates found so far, or
+    after max_buckets buckets were refined.
+    Returns (top list, exact) with exact being False if max_buckets was hit.
+    """
+    if len(steps) < 2:
+        return (top_scores(scorer, min_addr, max_addr, steps[0], top_n), True)
+    heap = []
+    for start in range(min_addr, max_addr, steps[0]):
+        stop = min(start + steps[0], max_addr)
+        bound = scorer.upper_bound(start, stop - start)
+        if bound > 0:
+            heap.append((-bound, start, stop, 0))
+    heapq.heapify(heap)
+    top = []
+    refined = 0
+    while len(heap) > 0:
+        (neg_bound, start, stop, level) = heapq.heappop(heap)
+        # Lower bases win ties, so a bucket with an equal bound can still beat
+        # the last entry if it starts below it
+        if len(top) == top_n and (-neg_bound, -start) <= (top[-1][1], -top[-1][0]):
+            break
+        if refined >= max_buckets:
+            return (top, False)
+        refined += 1
+        step = steps[level + 1]
+        if level + 2 == len(steps):
+            top = merge_top([top, top_scores(scorer, start, stop, step, top_n)], top_n)
+            continue
+        for sub_start in range(start, stop, step):
+            sub_stop = min(sub_start + step, stop)
+            bound = scorer.upper_bound(sub_start, sub_stop - sub_start)
+            if bound > 0:
+                heapq.heappush(heap, (-bound, sub_start, sub_stop, level + 1))
+    return (top, True)
+
+class BaseCandidate:
+    """
+    Base address candidate with the signals (heuristics) that point to it.
+    """
+
+    def __init__(self, base: int):
+        self.base = base
+        self.score = 0
+        self.evidence = {}
+        # Plausibility problems (misaligned, too_large), these demote a candidate
+        self.flags = []
+
+    def __repr__(self):
+        txt = "0x{:x}\t{:d}\t{}".format(self.base, self.score, ", ".join("{}: {}".format(k, v) for (k, v) in self.evidence.items()))
+        if self.flags:
+            txt += "\t(" + ", ".join(self.flags) + ")"
+        return txt
+
+def estimate_base(payload: bytes, offset: int=0, min_addr: int=0, max_addr: int=0xfe000000, step: int=0x1000, top_n: int=20, use_cache: bool=True, short_circuit: bool=True, big_endian: bool=False, align: int=4):
+    """
+    Combines several signals for the base address of the binary at offset in payload:
+    - end_marker: second header dword is the address of END_MARKER + 2 (thanks to kunix)
+    - arm_jump: entry point of ARM jump variants (see RgnBin.find_metadata())
+    - strings: pointers to string starts (see vote_bases())
+    If short_circuit and the cheap header signals agree, the string voting is skipped
+    and only that base is scored. Returns a list of BaseCandidate, best first;
+    candidates with flags rank below all others.
+    """
+    candidates = {}
+    def add(base, signal, info):
+        base &= 0xffffffff
+        if base not in candidates:
+            candidates[base] = BaseCandidate(base)
+        candidates[base].evidence[signal] = info
+
+    binary = payload[offset:]
+    size = len(binary)
+    if size >= 8:
+        end_addr = unpack(">L" if big_endian else "<L", binary[4:8])[0]
+        marker_pos = find_last(binary, END_MARKER)
+        if marker_pos >= 0:
+            add(end_addr - (marker_pos + 2), "end_marker", "0x{:x} at 0x{:x}".format(end_addr, offset + marker_pos))
+    load_address = get_load_address(binary)
+    if load_address is not None:
+        add(load_address[0], "arm_jump", "variant {}".format(load_address[1]))
+
+    (str_offsets, ptr_values, ptr_counts) = load_tables(binary, big_endian=big_endian, align=align, use_cache=use_cache)
+    (ptr_values, ptr_counts) = filter_pointers(ptr_values, ptr_counts, min_addr, max_addr + size)
+    scorer = BaseScorer(ptr_values, ptr_counts, str_offsets, size)
+
+    agreed = [c for c in candidates.values() if len(c.evidence) > 1]
+    if not short_circuit or len(agreed) == 0:
+        for (rank, (base, score)) in enumerate(vote_bases(scorer, min_addr, max_addr, step, top_n)):
+            add(base, "strings", "rank {:d}".format(rank + 1))
+    for candidate in candidates.values():
+        candidate.score = scorer.score(candidate.base)
+        if candidate.base % 4 != 0:
+            candidate.flags.append("misaligned")
+        if candidate.base + size > 0xffffffff:
+            candidate.flags.append("too_large")
+    ranked = sorted(candidates.values(), key=lambda c: (len(c.flags) > 0, -len(c.evidence), -c.score, c.base))
+    return ranked[:top_n]
+
+def save_state(filename: str, state: dict):
+    """
+    Atomically writes the search state (a JSON-serialisable dict) to filename.
+    """
+    cache.write_atomic(filename, lambda f: json.dump(state, f), "wt")
+
+def load_state(filename: str):
+    """
+    Reads a search state written by save_state().
+    """
+    with open(filename, "rt") as f:
+        state = json.load(f)
+        f.close()
+    state["top"] = [tuple(entry) for entry in state["top"]]
+    return state
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Many thanks to Alex W. who figured this out!
+
+"""
+Verifies the SHA1 trailer of (Fenix?) firmware binaries: the SHA1 of everything
+up to and including the END_PATTERN is stored in the 20 Bytes following it.
+"""
+
+from .endmarker import END_PATTERN, find_first
+from .mapfile import map_file
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha1
+from struct import unpack
+
+FENIX_HEADER = b"\xff\xff\xff\xff\xf0\xb9\x9d\x38\x0f\x46\x62\xc7"
+
+class Sha1Result:
+    def __init__(self, filename: str=None):
+        self.filename = filename
+        self.calculated = None
+        self.stored = None
+        self.trailer_pos = None
+        self.hwid = None
+        self.version = None
+        self.error = None
+
+    def has_trailer(self):
+        # Erased flash after the END_PATTERN is no trailer
+        return self.stored is not None and len(self.stored) == 20 and self.stored != b"\xff" * 20
+
+    def is_valid(self):
+        return self.has_trailer() and self.calculated == self.stored
+
+def get_fenix_info(payload: bytes):
+    """
+    Returns (hwid, version) from the Fenix firmware header in the first 4 KiB or None.
+    """
+    start = bytes(payload[0:4096]).find(FENIX_HEADER)
+    if start < 0:
+        return None
+    start += 4
+    hwid = unpack("<H", payload[start+24:start+24+2])[0]
+    version = unpack("<H", payload[start+28:start+28+2])[0]
+    return (hwid, version)
+
+def check_sha1(payload: bytes, filename: str=None):
+    """
+    Hashes the payload up to the end of the first END_PATTERN (or the whole payload
+    if there is none) and reads the stored SHA1 after it. Returns a Sha1Result.
+    Hashing a memoryview of a mapped file doesn't copy it and releases the GIL.
+    """
+    result = Sha1Result(filename)
+    info = get_fenix_info(payload)
+    if info is not None:
+        (result.hwid, result.version) = info
+    end_pos = find_first(payload, END_PATTERN)
+    if end_pos < 0:
+        marker_end = len(payload)
+    else:
+        marker_end = end_pos + len(END_PATTERN)
+        result.stored = bytes(payload[marker_end:marker_end+20])
+    result.trailer_pos = marker_end
+    result.calculated = sha1(payload[0:marker_end]).digest()
+    return result
+
+def check_file(filename: str):
+    try:
+        return check_sha1(map_file(filename), filename)
+    except OSError as e:
+        result = Sha1Result(filename)
+        result.error = e
+        return result
+
+def check_files(filenames, max_workers: int=None):
+    """
+    Checks the given files in a thread pool and yields their Sha1Results in order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(check_file, filenames)
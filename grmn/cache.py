@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""
+On-disk cache for analysis results, keyed by the content hash of the analysed data.
+Files are replaced atomically, so several processes can share one cache directory.
+"""
+
+from hashlib import sha1
+import os
+import tempfile
+
+CACHE_DIR = os.environ.get("GRMN_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "gcd-parser"))
+
+def get_cache_dir():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return CACHE_DIR
+
+def set_cache_dir(path: str):
+    global CACHE_DIR
+    CACHE_DIR = path
+
+def content_hash(payload: bytes):
+    """
+    Returns the SHA1 hex digest of the given bytes-like object.
+    """
+    return sha1(payload).hexdigest()
+
+def make_key(*parts):
+    """
+    Builds a cache key (usable as filename) from the given parts,
+    e.g. a content hash, an analysis name and its parameters.
+    """
+    params = "_".join(str(p) for p in parts[1:])
+    return "{}_{}".format(parts[0], sha1(params.encode("utf-8")).hexdigest()[:16])
+
+def get_path(key: str, extension: str):
+    return os.path.join(get_cache_dir(), "{}.{}".format(key, extension))
+
+def write_atomic(path: str, write, mode: str="wb"):
+    """
+    Calls write(f) with a temporary file next to path, then moves it to path. The temporary
+    file has a unique name, so concurrent writers (threads or processes) can't clobber it.
+    """
+    (fd, tmp_path) = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def load_arrays(key: str):
+    """
+    Returns a dict of NumPy arrays stored with save_arrays() or None if not cached.
+    """
+    import numpy as np
+    try:
+        path = get_path(key, "npz")
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as npz:
+            return {name: npz[name] for name in npz.files}
+    except (OSError, ValueError):
+        # Unusable cache directory or broken cache file, will be rebuilt
+        return None
+
+def save_arrays(key: str, **arrays):
+    """
+    Stores the given NumPy arrays compressed in the cache.
+    Does nothing if the cache directory isn't usable.
+    """
+    import numpy as np
+    try:
+        write_atomic(get_path(key, "npz"), lambda f: np.savez_compressed(f, **arrays))
+    except OSError:
+        pass
+
+def load_object(key: str):
+    """
+    Returns a Python object stored with save_object() or None if not cached.
+    """
+    import pickle
+    try:
+        path = get_path(key, "pickle")
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        # Unusable cache directory, broken or stale (classes moved/renamed) cache file, will be rebuilt
+        return None
+
+def save_object(key: str, obj):
+    """
+    Pickles obj into the cache. Does nothing if the cache directory isn't usable.
+    """
+    import pickle
+    try:
+        write_atomic(get_path(key, "pickle"), lambda f: pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import numpy as np
+
 class ChkSum:
 
     def __init__(self):
@@ -7,7 +9,8 @@ class ChkSum:
         self.last_byte = 0xff
 
     def add(self, data):
-        self.chksum += sum(bytearray(data))
+        # NumPy sums the buffer in place and without holding the GIL
+        self.chksum += int(np.frombuffer(data, np.uint8).sum(dtype=np.uint64))
         self.last_byte = data[-1]
         self.chksum &= 0xff
 
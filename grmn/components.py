@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""
+Index over the components*.txt lists which map SKUs (006-Bxxxx) and
+GUP ids (GUPxxxx) to firmware file paths.
+"""
+
+from . import cache
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENT_FILES = [
+    os.path.join(BASE_DIR, "components.txt"),
+    os.path.join(BASE_DIR, "components2.txt"),
+]
+INDEX_VERSION = 1
+
+def normalize_key(key):
+    """
+    Turns a hw_id, 006-Bxxxx-xx (or 006Bxxxxxx) SKU or GUPxxxx id into the key used in the lists.
+
+    >>> normalize_key("006-B2900-00")
+    '006-B2900'
+    >>> normalize_key("006B290000")
+    '006-B2900'
+    >>> normalize_key(2900)
+    '006-B2900'
+    >>> normalize_key("gup1630")
+    'GUP1630'
+    """
+    if type(key) is int or key.isnumeric():
+        return "006-B{:04d}".format(int(key))
+    key = key.upper()
+    compact = key.replace("-", "")
+    if compact.startswith("006B"):
+        return "006-B" + compact[4:8]
+    return key
+
+class ComponentIndex:
+    def __init__(self, lines):
+        """
+        lines are "KEY:path" strings.
+        """
+        self.paths = {}
+        self.keys = {}
+        for line in lines:
+            line = line.strip()
+            if not line or ":" not in line:
+                continue
+            (key, path) = line.split(":", 1)
+            self.paths.setdefault(key, []).append(path)
+            self.keys.setdefault(path, []).append(key)
+        self.basenames = {}
+        for path in self.keys:
+            self.basenames.setdefault(os.path.basename(path).lower(), []).append(path)
+
+    def get_paths(self, key):
+        """
+        Returns the paths listed for a hw_id, SKU or GUP id.
+        """
+        return self.paths.get(normalize_key(key), [])
+
+    def get_keys(self, path: str):
+        """
+        Returns the SKUs/GUP ids listed for a path. If the path isn't listed
+        as is, its file name is looked up instead.
+        """
+        if path in self.keys:
+            return self.keys[path]
+        keys = []
+        for listed in self.basenames.get(os.path.basename(path).lower(), []):
+            keys += self.keys[listed]
+        return keys
+
+    def get_skus(self, path: str):
+        return [k for k in self.get_keys(path) if not k.startswith("GUP")]
+
+    def get_gups(self, path: str):
+        return [k for k in self.get_keys(path) if k.startswith("GUP")]
+
+def build_index(filenames=COMPONENT_FILES):
+    lines = []
+    for filename in filenames:
+        with open(filename, "rt", encoding="utf-8") as f:
+            lines += f.readlines()
+    return ComponentIndex(lines)
+
+_index = None
+
+def get_index(use_cache: bool=True):
+    """
+    Returns the (process-wide) index, loaded from the cache if possible.
+    """
+    global _index
+    if _index is None:
+        key = None
+        if use_cache:
+            # Keyed by mtime and size, so a warm start doesn't read the lists at all
+            stats = []
+            for filename in COMPONENT_FILES:
+                stat = os.stat(filename)
+                stats += [filename, stat.st_mtime_ns, stat.st_size]
+            key = cache.make_key("components", INDEX_VERSION, *stats)
+            _index = cache.load_object(key)
+        if _index is None:
+            _index = build_index()
+            if key is not None:
+                cache.save_object(key, _index)
+    return _index
+
+def get_paths(key):
+    return get_index().get_paths(key)
+
+def get_keys(path: str):
+    return get_index().get_keys(path)
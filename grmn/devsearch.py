@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+"""
+Search device names by prefix, substring or similarity using a token and
+trigram index over devices.txt. The index is cached keyed by the contents
+of devices.txt.
+"""
+
+from . import cache, devices
+from bisect import bisect_left
+import re
+
+MODES = ["auto", "prefix", "substring", "fuzzy"]
+FUZZY_THRESHOLD = 0.3
+INDEX_VERSION = 1
+
+TOKEN_RE = re.compile(r"[0-9a-z]+")
+
+def tokenize(text: str):
+    return TOKEN_RE.findall(text.lower())
+
+def trigrams(text: str):
+    text = "  {} ".format(text.lower())
+    return {text[i:i+3] for i in range(len(text) - 2)}
+
+class DeviceIndex:
+    def __init__(self, entries):
+        """
+        entries is a list of (hwid, subid, name) tuples.
+        """
+        self.entries = entries
+        self.names = [name.lower() for (hwid, subid, name) in entries]
+        token_map = {}
+        gram_map = {}
+        self.gram_counts = []
+        for (i, (hwid, subid, name)) in enumerate(entries):
+            for token in tokenize(name) + [str(hwid)]:
+                token_map.setdefault(token, set()).add(i)
+            grams = trigrams(name)
+            self.gram_counts.append(len(grams))
+            for gram in grams:
+                gram_map.setdefault(gram, []).append(i)
+        self.tokens = sorted(token_map)
+        self.token_postings = [frozenset(token_map[t]) for t in self.tokens]
+        self.grams = {gram: frozenset(ids) for (gram, ids) in gram_map.items()}
+
+    def _prefix_ids(self, prefix: str):
+        ids = set()
+        i = bisect_left(self.tokens, prefix)
+        while i < len(self.tokens) and self.tokens[i].startswith(prefix):
+            ids |= self.token_postings[i]
+            i += 1
+        return ids
+
+    def _sorted(self, ids):
+        return [self.entries[i] for i in sorted(ids)]
+
+    def search_prefix(self, query: str):
+        """
+        Entries where every word of the query starts a word of the name
+        (or the hw_id), e.g. "fen 6" finds "fenix 6S Pro".
+        """
+        ids = None
+        for token in tokenize(query):
+            found = self._prefix_ids(token)
+            ids = found if ids is None else ids & found
+            if not ids:
+                return []
+        return self._sorted(ids or [])
+
+    def search_substring(self, query: str):
+        """
+        Entries containing the query anywhere in the name (case-insensitive).
+        """
+        query = query.lower()
+        if len(query) < 3:
+            return [self.entries[i] for (i, name) in enumerate(self.names) if query in name]
+        text = " {} ".format(query)
+        # Only inner trigrams, the padded ones are bound to word boundaries
+        ids = None
+        for i in range(1, len(text) - 3):
+            postings = self.grams.get(text[i:i+3])
+            if postings is None:
+                return []
+            ids = set(postings) if ids is None else ids & postings
+        return self._sorted(i for i in ids if query in self.names[i])
+
+    def search_fuzzy(self, query: str, threshold: float=FUZZY_THRESHOLD):
+        """
+        Entries whose trigram similarity (Jaccard) to the query is at least
+        threshold, best matches first.
+        """
+        query_grams = trigrams(query)
+        shared = {}
+        for gram in query_grams:
+            for i in self.grams.get(gram, ()):
+                shared[i] = shared.get(i, 0) + 1
+        results = []
+        for (i, count) in shared.items():
+            score = count / (len(query_grams) + self.gram_counts[i] - count)
+            if score >= threshold:
+                results.append((-score, i))
+        results.sort()
+        return [self.entries[i] for (score, i) in results]
+
+    def search(self, query: str, mode: str="auto", limit: int=None):
+        """
+        Returns a list of (hwid, subid, name). Mode "auto" does a prefix search
+        and falls back to a fuzzy search if nothing was found.
+        """
+        if mode not in MODES:
+            raise ValueError("Unknown search mode: {}".format(mode))
+        if mode == "substring":
+            results = self.search_substring(query)
+        elif mode == "fuzzy":
+            results = self.search_fuzzy(query)
+        else:
+            results = self.search_prefix(query)
+            if not results and mode == "auto":
+                results = self.search_fuzzy(query)
+        if limit is not None:
+            results = results[:limit]
+        return results
+
+def build_index():
+    entries = []
+    for (hwid, subids) in sorted(devices.load_devices().items()):
+        for (subid, name) in sorted(subids.items()):
+            entries.append((hwid, subid, name))
+    return DeviceIndex(entries)
+
+_index = None
+
+def get_index(use_cache: bool=True):
+    """
+    Returns the (process-wide) index, loaded from the cache if possible.
+    """
+    global _index
+    if _index is None:
+        key = None
+        if use_cache:
+            key = cache.make_key(cache.content_hash(devices.get_data()), "devsearch", INDEX_VERSION)
+            _index = cache.load_object(key)
+        if _index is None:
+            _index = build_index()
+            if key is not None:
+                cache.save_object(key, _index)
+    return _index
+
+def search(query: str, mode: str="auto", limit: int=None):
+    return get_index().search(query, mode, limit)
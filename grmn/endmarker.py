@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+"""
+Locating the end marker of firmware binaries (fw_all.bin etc.).
+"""
+
+from .mapfile import find, rfind
+from . import mapfile
+
+END_MARKER = b"\xff\xff\x5a\xa5"
+END_PATTERN = END_MARKER + b"\xff\xff\xff\xff"
+
+def find_first(payload: bytes, marker: bytes=END_PATTERN, start: int=0):
+    """
+    Returns the offset of the first marker in payload or -1.
+    """
+    return find(payload, marker, start)
+
+def find_last(payload: bytes, marker: bytes=END_PATTERN, start: int=0):
+    """
+    Returns the offset of the last marker in payload or -1.
+    """
+    return rfind(payload, marker, start)
+
+def find_all(payload: bytes, marker: bytes=END_PATTERN, start: int=0):
+    """
+    Returns the offsets of all markers in payload. Mapped files are searched
+    with mmap.find(), see mapfile.find_all().
+    """
+    return mapfile.find_all(payload, marker, start)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+"""
+Opens any supported firmware file with the matching parser.
+"""
+
+from .gcd import Gcd, GCD_SIG
+from .mapfile import map_file
+from .rgn import ParseException, Rgn, RGN_SIG
+from .rgnbin import RgnBin, BIN_JUMPS
+from struct import unpack
+import os
+
+def sniff(payload: bytes):
+    """
+    Identifies the file type from the first bytes of the payload.
+    Returns "GCD", "RGN", "BIN" or None if the type is unknown.
+    """
+    if bytes(payload[0:len(GCD_SIG)]) == GCD_SIG:
+        return "GCD"
+    if bytes(payload[0:len(RGN_SIG)]) == RGN_SIG:
+        return "RGN"
+    if len(payload) >= 4 and unpack("<L", payload[0:4])[0] in BIN_JUMPS:
+        return "BIN"
+    return None
+
+def open(source):
+    """
+    Opens the given filename or bytes-like object (e.g. mmap) as Gcd, Rgn or RgnBin,
+    depending on its signature. Raises ParseException for anything unknown; callers
+    wanting the raw data then can use map_file().
+    Files are mapped into memory once and the mapping is shared with all nested parsers.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        filename = os.fspath(source)
+        payload = map_file(filename)
+    else:
+        filename = None
+        payload = memoryview(source)
+    file_type = sniff(payload)
+    if file_type == "GCD":
+        obj = Gcd()
+    elif file_type == "RGN":
+        obj = Rgn()
+    elif file_type == "BIN":
+        obj = RgnBin()
+    else:
+        raise ParseException("Unknown file type: {}".format(filename or "(buffer)"))
+    obj.filename = filename
+    obj.load_from_bytes(payload)
+    return obj
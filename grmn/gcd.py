@@ -2,11 +2,12 @@
 # Thanks to TurboCCC and kunix for all your work!
 
 from .ansi import RED, GREEN, RESET
+from .binsum import check_sha1
 from .chksum import ChkSum
+from .mapfile import map_file
 from .tlv import TLV, TLV6, TLV7, TLVbinary
 from struct import unpack
 import configparser
-import os
 import sys
 
 GCD_SIG = b"G\x41RM\x49Nd\00"
@@ -14,6 +15,7 @@ DEFAULT_COPYRIGHT = b"Copyright 1996-2017 by G\x61rm\x69n Ltd. or its subsidiari
 DEFAULT_FIRST_PADDING = 21
 DEFAULT_ALIGN = 0x1000    # second padding block pads until 0x1000
 MAX_BLOCK_LENGTH = 0xff00   # binary blocks max len (0xff40 for some blocks)
+SHA1_TLVS = [ 0x02bd ]   # binaries which might have a SHA1 trailer (fw_all.bin)
 
 # Typical structure:
 # first 0x1000 Bytes: GCD_SIG > 0x0001 > 0x0002 > 0x0003 > 0x0005 > 0x0001 > 0x0002
@@ -29,47 +31,54 @@ class Gcd:
         self.is_truncated = False
         self.has_trailing = False
         if filename is not None:
-            self.file_len = os.path.getsize(self.filename)
             self.load()
 
     def load(self):
         if self.filename is None:
             return False
+        self.load_from_bytes(map_file(self.filename))
+
+    def load_from_bytes(self, payload: bytes):
         last_tlv6 = None
         last_tlv7 = None
-        with open(self.filename, "rb") as f:
-            sig = f.read(8)
-            if sig != GCD_SIG:
-                raise ParseException(RED + "Signature mismatch ({}, should be {})!".format(repr(sig) + RESET, repr(GCD_SIG)))
-            while True:
-                cur_offset = f.tell()
-                header = f.read(4)
-                if len(header) < 4:
-                    self.is_truncated = True
-                    #raise ParseException("File truncated. End marker not reached yet.")
-                    print(RED + "WARNING: File truncated. End marker not reached yet. (pos={})".format(f.tell()) + RESET, file=sys.stderr)
-                    break
-                (type_id, length) = unpack("<HH", header)
-                tlv = TLV.factory(type_id, length, offset=cur_offset)
-                self.add_tlv(tlv)
-                if tlv.type_id == 0xFFFF:
-                    # End of TLV structure reached
-                    break
-                tlength = tlv.length
-                payload = f.read(tlength)
-                tlv.set_value(payload)
-                if tlv.type_id == 0x0006:
-                    last_tlv6 = tlv
-                elif tlv.type_id == 0x0007:
-                    tlv.set_tlv6(last_tlv6)
-                    last_tlv7 = tlv
-                elif tlv.is_binary:
-                    tlv.set_tlv7(last_tlv7)
-            self.end_offset = f.tell()
-            self.trailing_bytes = self.file_len - self.end_offset
-            if (self.trailing_bytes > 0):
-                self.has_trailing = True
-            f.close()
+        self.file_len = len(payload)
+        sig = bytes(payload[0:8])
+        if sig != GCD_SIG:
+            raise ParseException(RED + "Signature mismatch ({}, should be {})!".format(repr(sig) + RESET, repr(GCD_SIG)))
+        pos = 8
+        while True:
+            cur_offset = pos
+            header = payload[pos:pos+4]
+            pos += len(header)
+            if len(header) < 4:
+                self.is_truncated = True
+                #raise ParseException("File truncated. End marker not reached yet.")
+                print(RED + "WARNING: File truncated. End marker not reached yet. (pos={})".format(pos) + RESET, file=sys.stderr)
+                break
+            (type_id, length) = unpack("<HH", header)
+            tlv = TLV.factory(type_id, length, offset=cur_offset)
+            self.add_tlv(tlv)
+            if tlv.type_id == 0xFFFF:
+                # End of TLV structure reached
+                break
+            tlength = tlv.length
+            value = payload[pos:pos+tlength]
+            pos += len(value)
+            if not tlv.is_binary:
+                # Only binary blocks stay views into the (mapped) payload
+                value = bytes(value)
+            tlv.set_value(value)
+            if tlv.type_id == 0x0006:
+                last_tlv6 = tlv
+            elif tlv.type_id == 0x0007:
+                tlv.set_tlv6(last_tlv6)
+                last_tlv7 = tlv
+            elif tlv.is_binary:
+                tlv.set_tlv7(last_tlv7)
+        self.end_offset = pos
+        self.trailing_bytes = self.file_len - self.end_offset
+        if (self.trailing_bytes > 0):
+            self.has_trailing = True
 
     def add_tlv(self, new_tlv: TLV):
         self.struct.append(new_tlv)
@@ -105,7 +114,30 @@ class Gcd:
         if (self.has_trailing):
             print(RED + "WARNING: {} trailing Bytes. Probably a signed firmware.".format(self.trailing_bytes) + RESET, file=sys.stderr)
 
-    def validate(self, print_stats: bool=False):
+    def get_binary(self, type_id: int):
+        """
+        Returns the joined payload of all binary TLVs of the given type.
+        """
+        return b"".join(tlv.value for tlv in self.struct if tlv.type_id == type_id and tlv.value is not None)
+
+    def get_components(self):
+        """
+        Returns a list of (type_id, offset, payload) for all binary components. A component
+        is a run of binary TLVs of one type with the same descriptor (TLV7), also split at
+        component headers (see TLVbinary.is_header()). offset is that of the first TLV.
+        """
+        components = []
+        last = None
+        for tlv in self.struct:
+            if not tlv.is_binary or tlv.value is None:
+                continue
+            if last is None or last.type_id != tlv.type_id or last.tlv7 is not tlv.tlv7 or tlv.is_header():
+                components.append((tlv.type_id, tlv.offset, []))
+            components[-1][2].append(tlv.value)
+            last = tlv
+        return [(type_id, offset, b"".join(values)) for (type_id, offset, values) in components]
+
+    def validate(self, print_stats: bool=False, verify_sha1: bool=True):
         """
         Checks and verifies all checksums in the GCD.
         """
@@ -127,6 +159,19 @@ class Gcd:
                     print("TLV{:04x} at 0x{:x}: {:02x} (expected: {:02x}) = {}".format(tlv.type_id, tlv.offset, file_cs, expected_cs, state))
                 if expected_cs != file_cs:
                     all_ok = False
+        if verify_sha1:
+            for type_id in SHA1_TLVS:
+                result = check_sha1(self.get_binary(type_id))
+                if not result.has_trailer():
+                    continue
+                if print_stats:
+                    if result.is_valid():
+                        state = GREEN + "OK" + RESET
+                    else:
+                        state = RED + "INVALID" + RESET
+                    print("SHA1 of TLV{:04x}: {} (expected: {}) = {}".format(type_id, result.stored.hex(), result.calculated.hex(), state))
+                if not result.is_valid():
+                    all_ok = False
         if print_stats:
             if all_ok:
                 print(GREEN + "☑ ALL CHECKSUMS VALID." + RESET)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shared HTTP client for the update servers: one pooled keep-alive session
+with timeouts, retries with backoff and per-endpoint metrics.
+"""
+
+from requests.adapters import HTTPAdapter
+from threading import Lock
+from urllib.parse import urlsplit
+from urllib3.util.retry import Retry
+import requests
+import time
+
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 30
+RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUS = (500, 502, 503, 504)
+POOL_SIZE = 16
+
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing rate requests per second on average
+    with bursts of up to burst requests.
+    """
+    def __init__(self, rate: float, burst: int=None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.tokens = float(self.burst)
+        self.last = time.monotonic()
+        self.lock = Lock()
+
+    def acquire(self):
+        """
+        Blocks until a token is available.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class EndpointStats:
+    def __init__(self, name: str):
+        self.name = name
+        self.requests = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.total_time = 0.0
+        self.min_time = None
+        self.max_time = 0.0
+
+    def add(self, duration: float, sent: int, received: int, error: bool=False):
+        self.requests += 1
+        if error:
+            self.errors += 1
+        self.bytes_sent += sent
+        self.bytes_received += received
+        self.total_time += duration
+        if self.min_time is None or duration < self.min_time:
+            self.min_time = duration
+        self.max_time = max(self.max_time, duration)
+
+    def avg_time(self):
+        if self.requests == 0:
+            return 0.0
+        return self.total_time / self.requests
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "total_time": self.total_time,
+            "avg_time": self.avg_time(),
+            "min_time": self.min_time,
+            "max_time": self.max_time,
+        }
+
+    def __str__(self):
+        return "{}: {} requests ({} failed), {} bytes sent, {} bytes received, {:.3f}s avg / {:.3f}s max".format(
+            self.name, self.requests, self.errors, self.bytes_sent, self.bytes_received, self.avg_time(), self.max_time)
+
+class HttpClient:
+    def __init__(self, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), retries: int=RETRIES, backoff_factor: float=BACKOFF_FACTOR, pool_size: int=POOL_SIZE):
+        """
+        timeout is seconds or a (connect, read) tuple. Connection errors and
+        5xx replies are retried up to retries times with exponential backoff.
+        """
+        self.timeout = timeout
+        retry = Retry(total=retries, connect=retries, read=retries, status=retries,
+                      backoff_factor=backoff_factor, status_forcelist=RETRY_STATUS,
+                      allowed_methods=None, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.stats = {}
+        self.lock = Lock()
+        self.rate = None
+        self.burst = None
+        self.buckets = {}
+
+    def set_rate_limit(self, rate: float, burst: int=None):
+        """
+        Limits requests to rate per second per host (None to disable).
+        """
+        with self.lock:
+            self.rate = rate
+            self.burst = burst
+            self.buckets = {}
+
+    def throttle(self, url: str):
+        with self.lock:
+            if self.rate is None:
+                return
+            host = urlsplit(url).netloc
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.rate, self.burst)
+            bucket = self.buckets[host]
+        bucket.acquire()
+
+    def post(self, endpoint: str, url: str, **kwargs):
+        """
+        POSTs to url and records the metrics under the given endpoint name.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        self.throttle(url)
+        start = time.perf_counter()
+        sent = 0
+        received = 0
+        error = True
+        try:
+            r = self.session.post(url, **kwargs)
+            if r.request.body is not None:
+                sent = len(r.request.body)
+            received = len(r.content)
+            error = r.status_code >= 400
+            return r
+        finally:
+            self.record(endpoint, time.perf_counter() - start, sent, received, error)
+
+    def record(self, endpoint: str, duration: float, sent: int, received: int, error: bool=False):
+        with self.lock:
+            if endpoint not in self.stats:
+                self.stats[endpoint] = EndpointStats(endpoint)
+            self.stats[endpoint].add(duration, sent, received, error)
+
+    def get_stats(self):
+        """
+        Returns a dict endpoint -> metrics dict.
+        """
+        with self.lock:
+            return {name: s.as_dict() for (name, s) in self.stats.items()}
+
+    def format_stats(self):
+        with self.lock:
+            return "\n".join(str(s) for s in self.stats.values())
+
+    def close(self):
+        self.session.close()
+
+_client = None
+
+def get_client():
+    """
+    Returns the process-wide client, created on first use.
+    """
+    global _client
+    if _client is None:
+        _client = HttpClient()
+    return _client
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+Finds 006-Bxxxx-xx or 006Bxxxxxx SKUs (hw_ids) in binary files.
+"""
+
+from .mapfile import map_file
+from concurrent.futures import ProcessPoolExecutor
+import os
+import re
+
+PATTERN = re.compile(rb"006-?B\d\d\d\d-?[0-9A-F]{2}")
+
+def normalize(sku: str):
+    """
+    Returns the SKU in 006-Bxxxx-xx format.
+    """
+    if len(sku) == 10:
+        sku = "{}-{}-{}".format(sku[0:3], sku[3:8], sku[8:])
+    return sku
+
+def scan(payload: bytes):
+    """
+    Returns a list of (offset, SKU) for all SKUs found in payload.
+    Runs directly on mapped files, so the file is never read into memory as a whole.
+    """
+    return [(m.start(), normalize(m.group(0).decode("utf-8"))) for m in PATTERN.finditer(payload)]
+
+def scan_file(filename: str):
+    """
+    Returns tuple (filename, list of (offset, SKU)). Unreadable files have no hits.
+    """
+    try:
+        return (filename, scan(map_file(filename)))
+    except OSError:
+        return (filename, [])
+
+def iter_files(paths):
+    """
+    Yields the given files and all files below the given directories.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for (dirpath, dirnames, filenames) in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    yield os.path.join(dirpath, filename)
+        else:
+            yield path
+
+def scan_paths(paths, max_workers: int=None):
+    """
+    Scans all files of the given paths in a process pool and yields
+    (filename, list of (offset, SKU)) in order.
+    """
+    filenames = list(iter_files(paths))
+    if max_workers == 1 or len(filenames) <= 1:
+        yield from map(scan_file, filenames)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(scan_file, filenames)
+
+def aggregate(results):
+    """
+    Returns a dict of SKU -> sorted list of files containing it.
+    """
+    sku_files = {}
+    for (filename, hits) in results:
+        for (offset, sku) in hits:
+            sku_files.setdefault(sku, set()).add(filename)
+    return {sku: sorted(files) for (sku, files) in sorted(sku_files.items())}
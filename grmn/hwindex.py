@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""
+Inverted index of hw_ids/SKUs referenced by firmware files, stored in SQLite.
+"""
+
+from . import hwids
+from .factory import open as open_firmware, sniff
+from .mapfile import map_file
+from .tlv import TLV7, TLVbinary0401
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import io
+import os
+import sqlite3
+
+# Same range devices.get_name() accepts, anything else is a bogus read
+MAX_HWID = 9999
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE,
+    size INTEGER,
+    mtime REAL
+);
+CREATE TABLE IF NOT EXISTS refs (
+    file_id INTEGER REFERENCES files(id) ON DELETE CASCADE,
+    hwid INTEGER,
+    sku TEXT,
+    source TEXT,
+    offset INTEGER
+);
+CREATE INDEX IF NOT EXISTS refs_hwid ON refs (hwid);
+CREATE INDEX IF NOT EXISTS refs_sku ON refs (sku);
+CREATE INDEX IF NOT EXISTS refs_file ON refs (file_id);
+"""
+
+def sku_to_hwid(sku: str):
+    return int(sku[5:9])
+
+def collect_refs(filename: str):
+    """
+    Returns a list of (hwid, sku, source, offset) for all hw_ids found in the file:
+    TLV7 descriptors (field 1009), TLV0401 SKU headers, RgnBin metadata and
+    006-Bxxxx-xx strings. sku is None if only the hw_id is known.
+    """
+    refs = []
+    payload = map_file(filename)
+    file_type = sniff(payload)
+    try:
+        # Parsers print diagnostics we don't want here
+        with contextlib.redirect_stdout(io.StringIO()):
+            if file_type is not None:
+                obj = open_firmware(payload)
+            if file_type == "GCD":
+                for tlv in obj.struct:
+                    if isinstance(tlv, TLV7) and tlv.tlv6 is not None:
+                        tlv.parse()
+                        for (fid, v) in tlv.attr:
+                            if fid == 0x1009:
+                                refs.append((v, None, "tlv7", tlv.offset))
+                    elif isinstance(tlv, TLVbinary0401) and tlv.value is not None and bytes(tlv.value[10:14]) == b"006B":
+                        sku = hwids.normalize(bytes(tlv.value[10:20]).decode("utf-8"))
+                        refs.append((sku_to_hwid(sku), sku, "tlv0401", tlv.offset))
+            elif file_type == "RGN":
+                for (path, rec, binfw) in obj.get_bin_regions():
+                    # Skip ZIP files and other non-firmware regions
+                    if binfw.hwid and sniff(binfw.payload) == "BIN":
+                        refs.append((binfw.hwid, None, "rgnbin", rec.get_file_offset()))
+            elif file_type == "BIN" and obj.hwid:
+                refs.append((obj.hwid, None, "rgnbin", 0))
+    except Exception:
+        # Not parseable, strings might still be found
+        pass
+    for (offset, sku) in hwids.scan(payload):
+        refs.append((sku_to_hwid(sku), sku, "string", offset))
+    return [ref for ref in refs if 0 <= ref[0] <= MAX_HWID]
+
+def _collect(filename: str):
+    try:
+        return (filename, collect_refs(filename))
+    except OSError:
+        return (filename, None)
+
+class HwIndex:
+    def __init__(self, filename: str):
+        self.db = sqlite3.connect(filename)
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def is_current(self, path: str):
+        stat = os.stat(path)
+        row = self.db.execute("SELECT size, mtime FROM files WHERE path = ?", (path,)).fetchone()
+        return row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime
+
+    def store(self, path: str, refs):
+        stat = os.stat(path)
+        self.db.execute("DELETE FROM files WHERE path = ?", (path,))
+        cur = self.db.execute("INSERT INTO files (path, size, mtime) VALUES (?, ?, ?)", (path, stat.st_size, stat.st_mtime))
+        file_id = cur.lastrowid
+        self.db.executemany("INSERT INTO refs (file_id, hwid, sku, source, offset) VALUES (?, ?, ?, ?, ?)",
+                            [(file_id,) + ref for ref in refs])
+
+    def add_paths(self, paths, max_workers: int=None):
+        """
+        Indexes all files of the given paths (see hwids.iter_files()) in a process pool.
+        Files which didn't change since the last run are skipped.
+        Yields (filename, number of refs or None if skipped/unreadable).
+        """
+        filenames = []
+        for filename in hwids.iter_files(paths):
+            path = os.path.abspath(filename)
+            if self.is_current(path):
+                yield (path, None)
+            else:
+                filenames.append(path)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for (path, refs) in executor.map(_collect, filenames):
+                if refs is not None:
+                    self.store(path, refs)
+                    self.db.commit()
+                    yield (path, len(refs))
+                else:
+                    yield (path, None)
+
+    def find(self, sku_or_hwid):
+        """
+        Returns a list of (path, hwid, sku, source, offset) referencing the given
+        SKU (006-Bxxxx-xx) or hw_id. For a SKU, references by hw_id only match, too.
+        """
+        query = "SELECT f.path, r.hwid, r.sku, r.source, r.offset FROM refs r JOIN files f ON f.id = r.file_id WHERE "
+        if type(sku_or_hwid) is str and not sku_or_hwid.isnumeric():
+            sku = hwids.normalize(sku_or_hwid)
+            rows = self.db.execute(query + "r.sku = ? OR (r.sku IS NULL AND r.hwid = ?) ORDER BY f.path, r.offset", (sku, sku_to_hwid(sku)))
+        else:
+            rows = self.db.execute(query + "r.hwid = ? ORDER BY f.path, r.offset", (int(sku_or_hwid),))
+        return rows.fetchall()
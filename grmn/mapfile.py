@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+Read-only memory mapping of firmware files plus pattern search on the mapped buffers.
+"""
+
+import mmap
+
+WINDOW_SIZE = 0x100000   # 1 MiB search windows for buffers without find()
+
+def map_file(filename: str):
+    """
+    Maps the whole file read-only into memory and returns a memoryview of it.
+    Slices of the view don't copy any data, so they can be handed to nested parsers.
+    """
+    with open(filename, "rb") as f:
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return memoryview(b"")
+        f.close()
+    return memoryview(mapping)
+
+def get_mmap(buf):
+    """
+    Returns the mmap object behind a memoryview returned by map_file() (or a
+    full-length slice of it), otherwise None.
+    """
+    if isinstance(buf, memoryview) and isinstance(buf.obj, mmap.mmap) and buf.nbytes == len(buf.obj) and buf.contiguous:
+        return buf.obj
+    return None
+
+def find(buf, pattern: bytes, start: int=0, end: int=None):
+    """
+    Returns the offset of the first occurrence of pattern in buf or -1.
+    Also works for memoryviews, which have no find() method.
+    """
+    if end is None:
+        end = len(buf)
+    if not isinstance(buf, memoryview):
+        return buf.find(pattern, start, end)
+    mapping = get_mmap(buf)
+    if mapping is not None:
+        return mapping.find(pattern, start, end)
+    overlap = len(pattern) - 1
+    pos = start
+    while pos < end:
+        win_end = min(pos + WINDOW_SIZE + overlap, end)
+        found = bytes(buf[pos:win_end]).find(pattern)
+        if found >= 0:
+            return pos + found
+        if win_end >= end:
+            break
+        pos += WINDOW_SIZE
+    return -1
+
+def rfind(buf, pattern: bytes, start: int=0, end: int=None):
+    """
+    Returns the offset of the last occurrence of pattern in buf or -1.
+    Also works for memoryviews, which have no rfind() method.
+    """
+    if end is None:
+        end = len(buf)
+    if not isinstance(buf, memoryview):
+        return buf.rfind(pattern, start, end)
+    mapping = get_mmap(buf)
+    if mapping is not None:
+        return mapping.rfind(pattern, start, end)
+    overlap = len(pattern) - 1
+    pos = end
+    while pos > start:
+        win_start = max(pos - WINDOW_SIZE - overlap, start)
+        found = bytes(buf[win_start:pos]).rfind(pattern)
+        if found >= 0:
+            return win_start + found
+        if win_start <= start:
+            break
+        pos -= WINDOW_SIZE
+    return -1
+
+def find_all(buf, pattern: bytes, start: int=0, end: int=None):
+    """
+    Returns the offsets of all occurrences of pattern in buf. Other memoryviews
+    than mapped files are copied window by window, each only once.
+    """
+    if end is None:
+        end = len(buf)
+    result = []
+    if not isinstance(buf, memoryview) or get_mmap(buf) is not None:
+        if isinstance(buf, memoryview):
+            buf = buf.obj
+        pos = buf.find(pattern, start, end)
+        while pos >= 0:
+            result.append(pos)
+            pos = buf.find(pattern, pos + 1, end)
+        return result
+    overlap = len(pattern) - 1
+    pos = start
+    while pos < end:
+        win_end = min(pos + WINDOW_SIZE + overlap, end)
+        window = bytes(buf[pos:win_end])
+        # Hits starting in the overlap are found again in the next window
+        limit = min(WINDOW_SIZE, end - pos)
+        found = window.find(pattern)
+        while 0 <= found < limit:
+            result.append(pos + found)
+            found = window.find(pattern, found + 1)
+        pos += WINDOW_SIZE
+    return result
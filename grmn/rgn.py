@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 # Thanks to Herbert Oppmann (herby) for all your work!
 
-from .ansi import RESET, RED, YELLOW
+from .ansi import RESET, RED, GREEN, YELLOW
 from .chksum import ChkSum
+from .mapfile import map_file
 from .rgnbin import RgnBin
+from concurrent.futures import ThreadPoolExecutor
 from struct import unpack
 import configparser
 
@@ -30,42 +32,79 @@ REGION_TYPES = {
     0x00ff: "pk_text.zip",
 }
 
+# Regions which might carry a SHA1 trailer after the END_PATTERN
+SHA1_REGIONS = [ 0x000e, 0x0055 ]
+
 class ParseException(Exception):
     pass
 
+def iter_regions(payload: bytes, recursive: bool=True, path: tuple=()):
+    """
+    Walks the record headers of an RGN payload and yields (path, contents) for every
+    region record, without parsing any other record. path is the tuple of region ids
+    leading to the region, contents is a slice of the payload (a view for memoryviews).
+    With recursive, regions of nested RGN structures are yielded after their wrapper.
+    """
+    sig = bytes(payload[0:4])
+    if sig != RGN_SIG:
+        raise ParseException("Signature mismatch ({}, should be {})!".format(repr(sig), repr(RGN_SIG)))
+    pos = 6
+    while pos + 5 <= len(payload):
+        (length, type_id) = unpack("<Lc", payload[pos:pos+5])
+        pos += 5
+        if type_id == b"R":
+            region_id = unpack("<H", payload[pos:pos+2])[0]
+            contents = payload[pos+10:pos+length]
+            region_path = path + (region_id,)
+            yield (region_path, contents)
+            if recursive and bytes(contents[0:4]) == RGN_SIG:
+                yield from iter_regions(contents, recursive, region_path)
+        pos += length
+
+def find_region(payload: bytes, path):
+    """
+    Returns the contents of the region at path (tuple of region ids, e.g. (0x00f5, 0x000e)
+    for a region in a nested RGN, or a single region id for a top-level region) or None.
+    Only the record headers along the path are read.
+    """
+    if type(path) is int:
+        path = (path,)
+    for (region_path, contents) in iter_regions(payload, recursive=False):
+        if region_path[0] != path[0]:
+            continue
+        if len(path) == 1:
+            return contents
+        if bytes(contents[0:4]) == RGN_SIG:
+            return find_region(contents, path[1:])
+    return None
+
+def read_region(filename: str, path):
+    """
+    Maps the RGN file and returns the contents of the region at path (see find_region())
+    without parsing the rest of the file.
+    """
+    return find_region(map_file(filename), path)
+
 class Rgn:
     def __init__(self, filename: str=None):
         self.filename = filename
         self.struct = []
+        self.reports = []
+        self.payload = None
+        # Offset of this structure in the file (non-zero for nested RGNs)
+        self.base_offset = 0
         if filename is not None:
             self.load()
 
     def load(self):
         if self.filename is None:
             return False
-        with open(self.filename, "rb") as f:
-            sig = f.read(4)
-            if sig != RGN_SIG:
-                raise ParseException("Signature mismatch ({}, should be {})!".format(repr(sig), repr(RGN_SIG)))
-            self.version = unpack("<H", f.read(2))[0]
-            while True:
-                cur_offset = f.tell()
-                header = f.read(5)
-                if len(header) == 0:
-                    #print("End of file reached.")
-                    break
-                (length, type_id) = unpack("<Lc", header)
-                #print("Found record type: {} with {} Bytes length.".format(type_id, length))
-                rec = RgnRecord.factory(type_id, length, offset=cur_offset)
-                rec.parent = self
-                payload = f.read(length)
-                rec.set_payload(payload)
-                self.add_rec(rec)
-            f.close()
+        self.load_from_bytes(map_file(self.filename))
 
     def load_from_bytes(self, payload: bytes):
+        self.payload = payload
         pos = 0
-        sig = payload[pos:pos+4]
+        sig = bytes(payload[pos:pos+4])
         if sig != RGN_SIG:
             raise ParseException("Signature mismatch ({}, should be {})!".format(repr(sig), repr(RGN_SIG)))
         pos += 4
@@ -87,6 +126,35 @@ class Rgn:
             rec.set_payload(inner_payload)
             self.add_rec(rec)
 
+    def iter_regions(self, recursive: bool=True):
+        """
+        Yields (path, contents) of all regions, see iter_regions().
+        """
+        return iter_regions(self.get_payload(), recursive)
+
+    def get_payload(self):
+        """
+        Returns the RGN data. If not loaded yet, the file is only mapped, not parsed.
+        """
+        if self.payload is None:
+            if self.filename is None:
+                raise ParseException("No RGN data loaded!")
+            self.payload = map_file(self.filename)
+        return self.payload
+
+    def get_region(self, region):
+        """
+        Returns the contents of the region at the given path (tuple of region ids,
+        see find_region()) or of the first region with the given id (also searching
+        nested RGN structures), or None. Records don't need to be parsed for this.
+        """
+        if type(region) is tuple:
+            return find_region(self.get_payload(), region)
+        for (path, contents) in self.iter_regions():
+            if path[-1] == region:
+                return contents
+        return None
+
     def add_rec(self, new_rec):
         self.struct.append(new_rec)
 
@@ -102,12 +170,47 @@ class Rgn:
         """
         self.print_struct()
 
-    def validate(self, print_stats: bool=False):
+    def get_bin_regions(self):
+        """
+        Returns a list of (path, record, RgnBin) for all binary payloads, including
+        those in nested RGN structures. path is the tuple of region ids leading there.
+        """
+        result = []
+        for rec in self.struct:
+            if not isinstance(rec, RgnRecordR):
+                continue
+            rec.parse()
+            for child in rec.children:
+                if isinstance(child, Rgn):
+                    for (path, inner_rec, binfw) in child.get_bin_regions():
+                        result.append(((rec.region_id,) + path, inner_rec, binfw))
+                else:
+                    result.append(((rec.region_id,), rec, child))
+        return result
+
+    def validate(self, print_stats: bool=False, max_workers: int=None):
         """
         Checks and verifies all checksums in the RGN.
         """
-        return True
         # RGN has no checksum, but embedded BIN has
+        regions = self.get_bin_regions()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            reports = list(executor.map(lambda r: RegionReport(*r), regions))
+        self.reports = reports
+        all_ok = True
+        if print_stats:
+            print("\nChecksum validation:")
+        for report in reports:
+            if print_stats:
+                print(report)
+            if not report.is_valid():
+                all_ok = False
+        if print_stats:
+            if all_ok:
+                print(GREEN + "☑ ALL CHECKSUMS VALID." + RESET)
+            else:
+                print(RED + "☒ ONE OR MORE CHECKSUMS INVALID!" + RESET)
+        return all_ok
 
     def dump_to_files(self, output_basename: str):
         pass
@@ -126,6 +229,47 @@ class Rgn:
             txt += "\n#{:03d}: {}".format(i, rec)
         return txt
 
+class RegionReport:
+    """
+    Checksum verification results of one binary region
+    """
+
+    def __init__(self, path, rec, binfw):
+        self.path = path
+        self.offset = rec.get_file_offset()
+        cksum = binfw.get_chksum()
+        self.chksum_ok = cksum.is_valid()
+        self.last_byte = cksum.get_last_byte()
+        self.expected = cksum.get_expected()
+        self.sha1_expected = path[-1] in SHA1_REGIONS
+        self.sha1 = None
+        if self.sha1_expected:
+            self.sha1 = binfw.get_sha1()
+
+    def is_valid(self):
+        if not self.chksum_ok:
+            return False
+        if self.sha1 is not None and self.sha1[0] != self.sha1[1]:
+            return False
+        return True
+
+    def __str__(self):
+        path = " > ".join("{:04x}".format(region_id) for region_id in self.path)
+        txt = "Region {} at 0x{:x}: {:02x} (expected: {:02x}) = ".format(path, self.offset, self.last_byte, self.expected)
+        if self.chksum_ok:
+            txt += GREEN + "OK" + RESET
+        else:
+            txt += RED + "INVALID" + RESET
+        if self.sha1 is not None:
+            txt += ", SHA1 {} = ".format(self.sha1[1].hex())
+            if self.sha1[0] == self.sha1[1]:
+                txt += GREEN + "OK" + RESET
+            else:
+                txt += RED + "INVALID" + RESET + " (calculated: {})".format(self.sha1[0].hex())
+        elif self.sha1_expected:
+            txt += ", no SHA1 trailer"
+        return txt
+
 class RgnRecord():
     def __init__(self, type_id, expected_length, payload=None, offset=None):
         self.parent = None
@@ -139,6 +283,14 @@ class RgnRecord():
     def set_payload(self, new_payload):
         self.payload = new_payload
 
+    def get_file_offset(self):
+        """
+        Returns the offset of the record in the file, also for records of nested RGNs.
+        """
+        if self.parent is None:
+            return self.offset
+        return self.parent.base_offset + self.offset
+
     @staticmethod
     def factory(type_id, length: int = None, offset: int = None):
         if type_id == b"D":
@@ -218,7 +370,7 @@ class RgnRecordA(RgnRecord):
             # already parsed
             return
         self.version = unpack("<H", self.payload[0:2])[0]
-        splits = self.payload[2:].split(b"\0", 2)
+        splits = bytes(self.payload[2:]).split(b"\0", 2)
         self.builder = splits[0].decode("utf-8")
         self.build_date = splits[1].decode("utf-8")
         self.build_time = splits[2].decode("utf-8")
@@ -247,6 +399,37 @@ class RgnRecordR(RgnRecord):
         self.region_id = None
         self.delay_ms = None
         self.size = None
+        self._children = None
+
+    def set_payload(self, new_payload):
+        super().set_payload(new_payload)
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Drops the parsed header and cached child structure, so they are
+        parsed again from the payload on next access.
+        """
+        self.is_parsed = False
+        self._children = None
+
+    @property
+    def children(self):
+        """
+        List of structures parsed from the region contents (nested Rgn or RgnBin).
+        Parsed only once, call invalidate() after modifying the payload.
+        """
+        if self._children is None:
+            if self.id_payload() == "RGN":
+                child = Rgn()
+                # Record header (5 Bytes) and region header (10 Bytes) precede the contents
+                child.base_offset = self.get_file_offset() + 5 + 10
+                child.load_from_bytes(self.payload[10:])
+            else:
+                child = RgnBin()
+                child.load_from_bytes(self.payload[10:])
+            self._children = [child]
+        return self._children
 
     def id_payload(self):
         if self.payload[10:10+len(RGN_SIG)] == RGN_SIG:
@@ -272,19 +455,8 @@ class RgnRecordR(RgnRecord):
             txt += " (OK)"
         else:
             txt += " (" + RED + "MISMATCH!" + RESET + ")"
-        payload_type = self.id_payload()
-        if payload_type == "RGN":
+        if self.id_payload() == "RGN":
             txt += "\n  " + YELLOW + "PAYLOAD IS ANOTHER RGN STRUCTURE:" + RESET
-            #with open("innerrgn.rgn", "wb") as f:
-            #    f.write(self.payload[10:])
-            #    f.close()
-            rgn = Rgn()
-            rgn.load_from_bytes(self.payload[10:])
-            txt += "\n      " + "\n      ".join(str(rgn).split("\n"))
-        elif payload_type == "BIN":
-            #with open("{}_{}.bin".format(self.parent.filename, self.offset), "wb") as f:
-            #    f.write(self.payload[10:])
-            binfw = RgnBin()
-            binfw.load_from_bytes(self.payload[10:])
-            txt += "\n      " + "\n      ".join(str(binfw).split("\n"))
+        for child in self.children:
+            txt += "\n      " + "\n      ".join(str(child).split("\n"))
         return txt
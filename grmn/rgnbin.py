@@ -4,39 +4,61 @@
 from . import devices
 from .ansi import RESET, RED, GREEN
 from .chksum import ChkSum
+from .binsum import check_sha1
+from .endmarker import END_PATTERN, find_last
+from .mapfile import map_file
 from struct import unpack
 
 # RGN structure might be: RGN > BIN or RGN > RGN > BIN
 # RGN = outside hull
 # BIN = firmware + hwid + checksum
 
-END_PATTERN = b"\xff\xff\x5a\xa5\xff\xff\xff\xff"
+# First instructions (ARM jumps) of BIN variants known to find_metadata()
+BIN_JUMPS = [ 0xe59ff008, 0xe59ff00c, 0xea000002, 0xea000003, 0xea000004 ]
 
 class ParseException(Exception):
     pass
 
+def get_load_address(payload: bytes):
+    """
+    Derives the load (base) address from the entry point of the ARM jump
+    variants 1 and 2 used by RgnBin.find_metadata().
+    Returns tuple (address, variant) or None.
+    """
+    if len(payload) < 24:
+        return None
+    jmp = unpack("<L", payload[0:4])[0]
+    if jmp == 0xe59ff008:
+        # Variant 1: entry point follows the 20 Bytes header
+        entry_addr = unpack("<L", payload[16:20])[0]
+        return ((entry_addr - 20) & 0xffffffff, "1")
+    if jmp == 0xe59ff00c:
+        # Variant 2: negative lend is the load address, else entry follows the 24 Bytes header
+        (lend_addr, entry_addr) = unpack("<lL", payload[16:24])
+        if lend_addr < 0:
+            return ((-lend_addr - 24) & 0xffffffff, "2")
+        return ((entry_addr - 24) & 0xffffffff, "2")
+    return None
+
 class RgnBin:
     def __init__(self, filename: str=None):
         self.filename = filename
         self.hwid = None
         self.version = None
         self.payload = None
+        self.cksum = None
         if filename is not None:
             self.load()
 
     def load(self):
         if self.filename is None:
             return False
-        with open(self.filename, "rb") as f:
-            rawdata = f.read()
-            f.close()
-        self.load_from_bytes(rawdata)
+        self.load_from_bytes(map_file(self.filename))
 
     def find_metadata(self):
-        try:
-            end_loc = self.payload.rindex(END_PATTERN)
-            #print("end_loc: {}".format(end_loc))
-        except ValueError:
+        end_loc = find_last(self.payload, END_PATTERN)
+        #print("end_loc: {}".format(end_loc))
+        if end_loc < 0:
             # No END_PATTERN found
             end_loc = None
         jmp = unpack("<L", self.payload[0:4])[0]
@@ -124,16 +146,35 @@ class RgnBin:
 
     def load_from_bytes(self, payload: bytes):
         self.payload = payload
+        self.cksum = None
         self.find_metadata()
 
+    def get_chksum(self):
+        """
+        Returns the ChkSum over the payload, calculated only once per load.
+        """
+        if self.cksum is None:
+            self.cksum = ChkSum()
+            self.cksum.add(self.payload)
+        return self.cksum
+
+    def get_sha1(self):
+        """
+        Returns tuple (calculated, stored) of SHA1 digests if the payload has
+        an END_PATTERN followed by a SHA1 trailer. Otherwise returns None.
+        """
+        result = check_sha1(self.payload)
+        if not result.has_trailer():
+            return None
+        return (result.calculated, result.stored)
+
     def __str__(self):
         txt = "Binary payload, {} Bytes".format(len(self.payload))
         if self.hwid:
             txt += "\n  -    hw_id: 0x{:04x} / {:d} ({})".format(self.hwid, self.hwid, devices.get_name(self.hwid, 0, RED + "Unknown device" + RESET))
         if self.version:
             txt += "\n  -  Version: 0x{:04x} / {:d}".format(self.version, self.version)
-        cksum = ChkSum()
-        cksum.add(self.payload)
+        cksum = self.get_chksum()
         exp_byte = cksum.get_expected()
         last_byte = cksum.get_last_byte()
         txt += "\n  - Checksum: {:02x} (expected: {:02x}) = ".format(last_byte, exp_byte)
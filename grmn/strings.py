@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+Extraction of printable strings from firmware files.
+"""
+
+from . import cache
+from .gcd import Gcd
+from .rgn import Rgn, RGN_SIG
+import numpy as np
+import re
+
+PRINTABLE = bytes(range(0x20, 0x7f)) + b"\t"
+MIN_LENGTH = 4
+WINDOW_SIZE = 0x4000000   # 64 MiB per vectorized pass to bound memory use
+
+def charset_from_class(char_class: str):
+    """
+    Returns all bytes matched by the given regex character class contents, e.g. "A-Za-z0-9".
+    """
+    pattern = re.compile(bytes("[{}]".format(char_class), "us-ascii"))
+    return bytes(b for b in range(256) if pattern.match(bytes([b])))
+
+def extract(payload: bytes, charset: bytes=PRINTABLE, min_length: int=MIN_LENGTH):
+    """
+    Returns arrays (offsets, lengths) of all maximal runs of at least min_length
+    bytes from charset. Works on windows of the payload with a lookup table and
+    run boundary detection in NumPy, so the payload is never copied as a whole.
+    """
+    lut = np.zeros(256, dtype=bool)
+    lut[np.frombuffer(charset, dtype=np.uint8)] = True
+    data = np.frombuffer(payload, dtype=np.uint8)
+    all_starts = []
+    all_ends = []
+    open_start = None
+    for pos in range(0, len(data), WINDOW_SIZE):
+        mask = lut[data[pos:pos+WINDOW_SIZE]]
+        edges = np.diff(np.concatenate(([False], mask, [False])).view(np.int8))
+        starts = np.flatnonzero(edges == 1) + pos
+        ends = np.flatnonzero(edges == -1) + pos
+        if open_start is not None:
+            # Run continued from previous window
+            if mask[0]:
+                starts[0] = open_start
+            else:
+                all_starts.append(np.array([open_start]))
+                all_ends.append(np.array([pos]))
+            open_start = None
+        if mask[-1] and pos + len(mask) < len(data):
+            # Run might continue in next window
+            open_start = int(starts[-1])
+            starts = starts[:-1]
+            ends = ends[:-1]
+        all_starts.append(starts)
+        all_ends.append(ends)
+    if open_start is not None:
+        all_starts.append(np.array([open_start]))
+        all_ends.append(np.array([len(data)]))
+    if len(all_starts) == 0:
+        return (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+    offsets = np.concatenate(all_starts).astype(np.int64)
+    lengths = np.concatenate(all_ends).astype(np.int64) - offsets
+    keep = lengths >= min_length
+    return (offsets[keep], lengths[keep])
+
+def get_strings(payload: bytes, charset: bytes=PRINTABLE, min_length: int=MIN_LENGTH, use_cache: bool=True):
+    """
+    Like extract(), but results are cached by the content hash of the payload.
+    """
+    if not use_cache:
+        return extract(payload, charset, min_length)
+    key = cache.make_key(cache.content_hash(payload), "strings", charset.hex(), min_length)
+    arrays = cache.load_arrays(key)
+    if arrays is not None:
+        return (arrays["offsets"], arrays["lengths"])
+    (offsets, lengths) = extract(payload, charset, min_length)
+    cache.save_arrays(key, offsets=offsets, lengths=lengths)
+    return (offsets, lengths)
+
+def iter_regions(obj):
+    """
+    Yields (region, payload) for the binary parts of a parsed file: (path of region ids)
+    for Rgn, (type id, offset of first TLV) per component for Gcd (see Gcd.get_components())
+    or None for anything else
+    (parsed objects with a payload, or plain bytes-like objects).
+    """
+    if isinstance(obj, Rgn):
+        for (path, contents) in obj.iter_regions():
+            if bytes(contents[0:4]) != RGN_SIG:
+                yield (path, contents)
+    elif isinstance(obj, Gcd):
+        for (type_id, offset, payload) in obj.get_components():
+            yield ((type_id, offset), payload)
+    elif hasattr(obj, "payload"):
+        yield (None, obj.payload)
+    else:
+        yield (None, obj)
+
+def get_region_strings(obj, charset: bytes=PRINTABLE, min_length: int=MIN_LENGTH, use_cache: bool=True):
+    """
+    Yields (region, payload, offsets, lengths) with offsets relative to the region,
+    see iter_regions().
+    """
+    for (region, payload) in iter_regions(obj):
+        (offsets, lengths) = get_strings(payload, charset, min_length, use_cache)
+        yield (region, payload, offsets, lengths)
@@ -383,6 +383,12 @@ class TLVbinary(TLV):
     def set_tlv7(self, tlv7: TLV7):
         self.tlv7 = tlv7
 
+    def is_header(self):
+        """
+        True if this TLV starts a new component of its type.
+        """
+        return False
+
     def dump(self):
         data = []
         # type is given in fields list from TLV7 already
@@ -406,18 +412,22 @@ class TLVbinary(TLV):
         return data
 
 class TLVbinary0401(TLVbinary):
+    def is_header(self):
+        # Each component starts with an SKU or Software Inventory header
+        return self.value is not None and bytes(self.value[10:14]) in [b"006B", b"SW_I"]
+
     def __str__(self):
         txt = super().__str__()
         skuprobe = self.value[10:14]
         if skuprobe == b"006B":
             version = unpack("<H", self.value[4:6])[0]
-            sku = self.value[10:20].decode("utf-8")
+            sku = bytes(self.value[10:20]).decode("utf-8")
             hwid = int(sku[4:8])
             txt += "\n  -     SKU: {}-{}-{}".format(sku[0:3], sku[3:8], sku[8:10])
             txt += "\n  -   hw_id: 0x{:04x} / {:d} ({})".format(hwid, hwid, devices.get_name(hwid, 0, RED + "Unknown device" + RESET))
             txt += "\n  - Version: 0x{:04x} / {:d}".format(version, version)
         elif skuprobe == b"SW_I":
-            swistring = self.value[10:20].decode("utf-8")
+            swistring = bytes(self.value[10:20]).decode("utf-8")
             payloadprobe = self.value[0x40:0x42]
             txt += "\n - Type: Software Inventory ({}) - actual payload starts at 0x40".format(swistring)
             if payloadprobe == b"PK":
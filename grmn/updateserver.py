@@ -5,15 +5,21 @@ Many thanks to Alex Whiter whom this work is based on.
 See https://github.com/AlexWhiter/GarminRelatedStuff/tree/master/GetFirmwareUpdates .
 """
 
-from . import devices
+from . import cache, devices, httpclient
 from .proto import GetAllUnitSoftwareUpdates_pb2
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from hashlib import sha1
+from threading import Lock
 from xml.dom.minidom import getDOMImplementation, parseString
 from urllib.parse import unquote
-import requests
+import os
+import time
 
 PROTO_API_GETALLUNITSOFTWAREUPDATES_URL = "http://omt.garmin.com/Rce/ProtobufApi/SoftwareUpdateService/GetAllUnitSoftwareUpdates"
 WEBUPDATER_SOFTWAREUPDATE_URL = "https://www.garmin.com/support/WUSoftwareUpdate.jsp"
 GRMN_CLIENT_VERSION = "6.19.4.0"
+RESPONSE_CACHE_TTL = 6 * 3600
+RESPONSE_CACHE_MAX_SIZE = 256 * 1024 * 1024
 
 
 class UpdateInfo:
@@ -108,12 +114,132 @@ class UpdateInfo:
         return "[{}] {} {} {}".format(self.source, self.sku, self.device_name, self.fw_version)
 
 
+class ResponseCache:
+    """
+    On-disk cache of raw server replies, keyed by endpoint and the SHA1 of the
+    request. Entries expire after ttl seconds, the least recently used ones are
+    removed once the cache grows beyond max_size bytes.
+    Raises OSError if the cache directory can't be created.
+    """
+    def __init__(self, path: str=None, ttl: float=RESPONSE_CACHE_TTL, max_size: int=RESPONSE_CACHE_MAX_SIZE):
+        if path is None:
+            path = os.path.join(cache.get_cache_dir(), "responses")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self.size = None
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def get_path(self, endpoint: str, request: bytes):
+        return os.path.join(self.path, "{}_{}.bin".format(endpoint, sha1(request).hexdigest()))
+
+    def get(self, endpoint: str, request: bytes):
+        """
+        Returns the cached reply or None if there is none or it expired.
+        """
+        path = self.get_path(endpoint, request)
+        try:
+            stat = os.stat(path)
+            if time.time() - stat.st_mtime > self.ttl:
+                raise FileNotFoundError(path)
+            with open(path, "rb") as f:
+                content = f.read()
+            # atime marks the last use, mtime the age
+            os.utime(path, (time.time(), stat.st_mtime))
+        except OSError:
+            with self.lock:
+                self.misses += 1
+            return None
+        with self.lock:
+            self.hits += 1
+        return content
+
+    def put(self, endpoint: str, request: bytes, content: bytes):
+        try:
+            # Several threads might store the same reply
+            cache.write_atomic(self.get_path(endpoint, request), lambda f: f.write(content))
+        except OSError:
+            # Not cached, but the reply is still good
+            return
+        with self.lock:
+            if self.size is None:
+                self.size = sum(e.stat().st_size for e in os.scandir(self.path) if e.name.endswith(".bin"))
+            else:
+                self.size += len(content)
+            if self.size > self.max_size:
+                self.evict()
+
+    def evict(self):
+        """
+        Removes expired entries, then the least recently used ones until the
+        cache is below 90% of max_size.
+        """
+        now = time.time()
+        entries = []
+        size = 0
+        for e in os.scandir(self.path):
+            if not e.name.endswith(".bin"):
+                continue
+            try:
+                stat = e.stat()
+                if now - stat.st_mtime > self.ttl:
+                    os.remove(e.path)
+                    continue
+            except OSError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, e.path))
+            size += stat.st_size
+        entries.sort()
+        for (atime, entry_size, path) in entries:
+            if size <= self.max_size * 0.9:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= entry_size
+        self.size = size
+
+    def format_stats(self):
+        return "cache: {} hits, {} misses".format(self.hits, self.misses)
+
+
 class UpdateServer:
 
-    def __init__(self):
+    def __init__(self, client: httpclient.HttpClient=None, response_cache: ResponseCache=None):
         self.device_id = "2345678910"
         self.unlock_codes = []
         self.debug = False
+        if client is None:
+            client = httpclient.get_client()
+        self.client = client
+        self.response_cache = response_cache
+        # Don't use cached replies, but still store new ones
+        self.refresh_cache = False
+
+    def post_cached(self, endpoint: str, url: str, request: bytes, **kwargs):
+        """
+        POSTs to url unless a reply for the same request is cached.
+        Returns the raw reply.
+        """
+        if self.response_cache is not None and not self.refresh_cache:
+            content = self.response_cache.get(endpoint, request)
+            if content is not None:
+                return content
+
+        r = self.client.post(endpoint, url, **kwargs)
+
+        if r.status_code != 200:
+            r.raise_for_status()
+            return None
+
+        if self.response_cache is not None:
+            self.response_cache.put(endpoint, request, r.content)
+
+        return r.content
 
     def query_express(self, sku_numbers):
         # Garmin Express Protobuf API
@@ -160,6 +286,53 @@ class UpdateServer:
 
         return results
 
+    def query_bulk(self, sku_numbers, query_express=True, query_webupdater=True, max_workers: int=8, batch_size: int=10):
+        """
+        Queries many SKUs in batches of batch_size on a thread pool.
+        Yields (batch, source, results, error) as soon as each query finishes,
+        i.e. not in input order. source is "Express" or "WebUpdater", error
+        is the exception if the query failed (results is then None).
+        Use client.set_rate_limit() to throttle the requests per host.
+        """
+        queries = []
+        if query_express:
+            queries.append(("Express", self.query_express))
+        if query_webupdater:
+            queries.append(("WebUpdater", self.query_webupdater))
+
+        def tasks():
+            batch = []
+            for sku in sku_numbers:
+                batch.append(sku)
+                if len(batch) == batch_size:
+                    for q in queries:
+                        yield (batch, q)
+                    batch = []
+            if batch:
+                for q in queries:
+                    yield (batch, q)
+
+        def run(batch, query):
+            (source, func) = query
+            try:
+                return (batch, source, func(batch), None)
+            except Exception as e:
+                return (batch, source, None, e)
+
+        # Only keep a few tasks queued so huge SKU lists don't pile up as futures
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = set()
+            for (batch, query) in tasks():
+                pending.add(executor.submit(run, batch, query))
+                if len(pending) >= max_workers * 2:
+                    (done, pending) = wait(pending, return_when=FIRST_COMPLETED)
+                    for f in done:
+                        yield f.result()
+            while pending:
+                (done, pending) = wait(pending, return_when=FIRST_COMPLETED)
+                for f in done:
+                    yield f.result()
+
     def dom_add_text(self, doc, parent, elem_name, text):
         e = doc.createElement(elem_name)
         t = doc.createTextNode(text)
@@ -260,20 +433,19 @@ class UpdateServer:
             "Content-Type": "application/octet-stream",
         }
 
-        r = requests.post(PROTO_API_GETALLUNITSOFTWAREUPDATES_URL, headers=headers, data=proto_msg)
+        content = self.post_cached("express", PROTO_API_GETALLUNITSOFTWAREUPDATES_URL, proto_msg, headers=headers, data=proto_msg)
 
-        if r.status_code != 200:
-            r.raise_for_status()
+        if content is None:
             return None
 
         if self.debug:
-            #print(r.content)
+            #print(content)
             with open("protoreply.bin", "wb") as f:
-                f.write(r.content)
+                f.write(content)
                 f.close()
 
         reply = GetAllUnitSoftwareUpdates_pb2.GetAllUnitSoftwareUpdatesReply()
-        reply.ParseFromString(r.content)
+        reply.ParseFromString(content)
 
         return reply
 
@@ -286,16 +458,15 @@ class UpdateServer:
             "req": requests_xml,
         }
 
-        r = requests.post(WEBUPDATER_SOFTWAREUPDATE_URL, headers=headers, data=data)
+        content = self.post_cached("webupdater", WEBUPDATER_SOFTWAREUPDATE_URL, requests_xml, headers=headers, data=data)
 
-        if r.status_code != 200:
-            r.raise_for_status()
+        if content is None:
             return None
 
         if self.debug:
-            #print(r.content)
+            #print(content)
             with open("webupdaterreply.xml", "wb") as f:
-                f.write(r.content)
+                f.write(content)
                 f.close()
 
-        return r.content
+        return content
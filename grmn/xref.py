@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+Cross references from pointers to strings once the base address of a binary is known.
+"""
+
+from .basefind import CHARS, load_tables
+import json
+import numpy as np
+import re
+import sqlite3
+
+def get_pointer_words(payload: bytes, big_endian: bool=False, align: int=4):
+    """
+    Returns arrays (locations, values) of all 32 bit words at file offsets
+    which are multiples of align, sorted by location.
+    """
+    dtype = np.dtype(">u4" if big_endian else "<u4")
+    locations = []
+    values = []
+    for offset in range(0, 4, align):
+        count = (len(payload) - offset) // 4
+        if count <= 0:
+            continue
+        values.append(np.frombuffer(payload, dtype=dtype, count=count, offset=offset).astype(np.int64))
+        locations.append(np.arange(offset, offset + count * 4, 4, dtype=np.int64))
+    if len(values) == 0:
+        return (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+    locations = np.concatenate(locations)
+    values = np.concatenate(values)
+    order = np.argsort(locations, kind="stable")
+    return (locations[order], values[order])
+
+def find_xrefs(payload: bytes, base: int, str_offsets=None, big_endian: bool=False, align: int=4):
+    """
+    Returns arrays (locations, str_offsets) of all words pointing to a string start
+    if payload is loaded at base. The string table is taken from the cache if not given.
+    """
+    if str_offsets is None:
+        str_offsets = load_tables(payload, big_endian=big_endian, align=align)[0]
+    (locations, values) = get_pointer_words(payload, big_endian, align)
+    targets = values - base
+    mask = (targets >= 0) & (targets < len(payload))
+    locations = locations[mask]
+    targets = targets[mask]
+    if len(str_offsets) == 0:
+        return (locations[:0], targets[:0])
+    idx = np.minimum(np.searchsorted(str_offsets, targets), len(str_offsets) - 1)
+    hits = str_offsets[idx] == targets
+    return (locations[hits], targets[hits])
+
+def iter_xrefs(payload: bytes, base: int, chars: str=CHARS, **kwargs):
+    """
+    Yields dicts with pointer location, string offset, their addresses and the decoded string.
+    """
+    pattern = re.compile(bytes("[{}]+".format(chars), "us-ascii"))
+    texts = {}
+    (locations, targets) = find_xrefs(payload, base, **kwargs)
+    for (location, target) in zip(locations.tolist(), targets.tolist()):
+        if target not in texts:
+            texts[target] = pattern.match(payload, target).group(0).decode("us-ascii")
+        yield {
+            "ptr": location,
+            "ptr_addr": base + location,
+            "str": target,
+            "str_addr": base + target,
+            "text": texts[target],
+        }
+
+def write_jsonl(f, xrefs):
+    count = 0
+    for xref in xrefs:
+        f.write(json.dumps(xref) + "\n")
+        count += 1
+    return count
+
+def write_sqlite(filename: str, xrefs):
+    """
+    Writes the cross references into table xrefs of the given SQLite database.
+    """
+    db = sqlite3.connect(filename)
+    db.execute("CREATE TABLE IF NOT EXISTS xrefs (ptr INTEGER, ptr_addr INTEGER, str INTEGER, str_addr INTEGER, text TEXT)")
+    db.execute("DELETE FROM xrefs")
+    cur = db.executemany("INSERT INTO xrefs VALUES (:ptr, :ptr_addr, :str, :str_addr, :text)", xrefs)
+    count = cur.rowcount
+    db.execute("CREATE INDEX IF NOT EXISTS xrefs_str ON xrefs (str)")
+    db.execute("CREATE INDEX IF NOT EXISTS xrefs_text ON xrefs (text)")
+    db.commit()
+    db.close()
+    return count
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Builds and queries an index of all hw_ids/SKUs referenced by a firmware collection.
+"""
+
+from grmn import components, devices
+from grmn.hwindex import HwIndex
+import argparse
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", help="index database file", default="hwid_index.db")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    parser_add = subparsers.add_parser("add", help="add files or directories to the index")
+    parser_add.add_argument("--jobs", type=int, help="number of worker processes (default: all CPUs)", default=None)
+    parser_add.add_argument("paths", nargs="+", metavar="PATH")
+    parser_find = subparsers.add_parser("find", help="list files referencing a SKU (006-Bxxxx-xx) or hw_id")
+    parser_find.add_argument("skus", nargs="+", metavar="SKU")
+    args = parser.parse_args()
+
+    index = HwIndex(args.db)
+
+    if args.command == "add":
+        for (path, count) in index.add_paths(args.paths, args.jobs):
+            if count is None:
+                print("Skipped {}".format(path))
+            else:
+                print("Indexed {} ({} references)".format(path, count))
+    elif args.command == "find":
+        for sku in args.skus:
+            rows = index.find(sku)
+            print("{} - {} references".format(sku, len(rows)))
+            for (path, hwid, found_sku, source, offset) in rows:
+                name = devices.get_name(hwid, 0, "Unknown device")
+                print("  {} ({} at 0x{:x}: {} / {})".format(path, source, offset, found_sku or hwid, name))
+            for path in components.get_paths(sku):
+                print("  Listed component: {}".format(path))
+
+    index.close()
@@ -15,4 +15,4 @@ print("Opening {}".format(FILE))
 rgn = Rgn(FILE)
 
 rgn.print_struct()
-#rgn.validate(True)
+rgn.validate(True)